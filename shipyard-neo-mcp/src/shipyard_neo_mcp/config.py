@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 
@@ -19,6 +22,13 @@ def _read_positive_int_env(name: str, default: int) -> int:
     return parsed
 
 
+def _read_bool_env(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 MAX_TOOL_TEXT_CHARS = _read_positive_int_env("SHIPYARD_MAX_TOOL_TEXT_CHARS", 12000)
 MAX_SANDBOX_CACHE_SIZE = _read_positive_int_env("SHIPYARD_SANDBOX_CACHE_SIZE", 256)
 MAX_WRITE_FILE_BYTES = _read_positive_int_env(
@@ -28,10 +38,20 @@ MAX_TRANSFER_FILE_BYTES = _read_positive_int_env(
     "SHIPYARD_MAX_TRANSFER_FILE_BYTES", 50 * 1024 * 1024
 )
 SDK_CALL_TIMEOUT = _read_positive_int_env("SHIPYARD_SDK_CALL_TIMEOUT", 600)
+SKILL_PAYLOAD_CACHE_SIZE = _read_positive_int_env(
+    "SHIPYARD_SKILL_PAYLOAD_CACHE_SIZE", 128
+)
+SKILL_PAYLOAD_CACHE_TTL = _read_positive_int_env("SHIPYARD_SKILL_PAYLOAD_CACHE_TTL", 60)
+PREWARM_SANDBOX = _read_bool_env("SHIPYARD_PREWARM_SANDBOX", False)
+
 
+@functools.lru_cache(maxsize=1)
+def get_config() -> Mapping[str, Any]:
+    """Get configuration from environment variables.
 
-def get_config() -> dict[str, Any]:
-    """Get configuration from environment variables."""
+    The result is cached for the process and read-only, since every caller
+    shares it; call :func:`reset_config` after changing the environment.
+    """
     endpoint = os.environ.get("SHIPYARD_ENDPOINT_URL") or os.environ.get("BAY_ENDPOINT")
     token = os.environ.get("SHIPYARD_ACCESS_TOKEN") or os.environ.get("BAY_TOKEN")
 
@@ -57,9 +77,19 @@ def get_config() -> dict[str, Any]:
     if default_ttl < 0:
         default_ttl = 3600
 
-    return {
-        "endpoint_url": endpoint,
-        "access_token": token,
-        "default_profile": default_profile,
-        "default_ttl": default_ttl,
-    }
+    return MappingProxyType(
+        {
+            "endpoint_url": endpoint,
+            "access_token": token,
+            "default_profile": default_profile,
+            "default_ttl": default_ttl,
+        }
+    )
+
+
+def reset_config() -> None:
+    """Drop the cached configuration so the next get_config() re-reads it.
+
+    Intended for tests that change ``SHIPYARD_*`` environment variables.
+    """
+    get_config.cache_clear()
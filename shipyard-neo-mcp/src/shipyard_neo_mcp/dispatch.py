@@ -0,0 +1,118 @@
+"""Tool handler invocation and error-to-response conversion."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from mcp.types import TextContent
+
+from shipyard_neo import BayError
+
+from shipyard_neo_mcp import config as _config
+from shipyard_neo_mcp.serialization import dumps_capped
+
+logger = logging.getLogger("shipyard_neo_mcp")
+
+# Signature shared by every tool handler.
+ToolHandler = Callable[[dict[str, Any]], Awaitable[list[TextContent]]]
+
+# Response templates, bound once at import.
+_API_ERROR = "**API Error:** [{}] {}{}".format
+_UNEXPECTED_ERROR = "**Error:** {}".format
+
+# An identical failure is logged at most once per this many seconds, so a
+# fault storm (e.g. Bay being unreachable) does not flood stderr with
+# repeated warnings and tracebacks. Responses are never suppressed.
+_LOG_REPEAT_WINDOW = 1.0
+_MAX_LOG_SIGNATURES = 128
+# (tool, exception type, message prefix) -> last time it was logged.
+# Insertion order is recency order.
+_last_logged: dict[tuple[str, type, str], float] = {}
+# Clock used for the window; a module attribute so tests can substitute it.
+_clock = time.monotonic
+
+
+def _should_log(name: str, error: BaseException, message: str) -> bool:
+    """Return False when the same failure was logged within the window."""
+    key = (name, type(error), message[:60])
+    now = _clock()
+    last = _last_logged.pop(key, None)
+    if last is not None and now - last < _LOG_REPEAT_WINDOW:
+        _last_logged[key] = last
+        return False
+    _last_logged[key] = now
+    if len(_last_logged) > _MAX_LOG_SIGNATURES:
+        del _last_logged[next(iter(_last_logged))]
+    return True
+
+
+def format_bay_error(error: BayError) -> str:
+    suffix = ""
+    if error.details:
+        suffix = f"\n\ndetails: {dumps_capped(error.details, limit=1000)}"
+    return _API_ERROR(error.code, error.message, suffix)
+
+
+def _format_validation_error(error: ValueError, name: str) -> str:
+    return f"**Validation Error:** {error!s}"
+
+
+def _format_timeout_error(error: TimeoutError, name: str) -> str:
+    timeout = _config.SDK_CALL_TIMEOUT
+    if logger.isEnabledFor(logging.WARNING) and _should_log(name, error, ""):
+        logger.warning("tool_timeout tool=%s timeout=%ds", name, timeout)
+    return f"**Timeout Error:** SDK call timed out after {timeout}s"
+
+
+def _format_bay_error_response(error: BayError, name: str) -> str:
+    if logger.isEnabledFor(logging.WARNING) and _should_log(
+        name, error, f"{error.code}:{error.message}"
+    ):
+        logger.warning(
+            "bay_error tool=%s code=%s message=%s", name, error.code, error.message
+        )
+    return format_bay_error(error)
+
+
+def _format_unexpected_error(error: Exception, name: str) -> str:
+    message = str(error)
+    if _should_log(name, error, message):
+        # Called from inside the except block, so the traceback is still
+        # attached.
+        logger.exception("unexpected_error tool=%s", name)
+    return _UNEXPECTED_ERROR(message)
+
+
+# Exception class -> response formatter, resolved through the raised
+# exception's MRO so subclasses (e.g. NotFoundError) use their base's entry.
+_ERR_HANDLERS: dict[type[Exception], Callable[[Any, str], str]] = {
+    ValueError: _format_validation_error,
+    TimeoutError: _format_timeout_error,
+    BayError: _format_bay_error_response,
+    Exception: _format_unexpected_error,
+}
+
+
+def format_error(e: BaseException, name: str) -> str | None:
+    """Return the response text for a handler failure, or None to re-raise."""
+    for cls in type(e).__mro__:
+        formatter = _ERR_HANDLERS.get(cls)
+        if formatter is not None:
+            return formatter(e, name)
+    return None
+
+
+async def dispatch(
+    handler: ToolHandler, name: str, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Run one tool handler, converting failures into text responses."""
+    try:
+        return await handler(arguments)
+    except Exception as e:
+        text = format_error(e, name)
+        if text is None:
+            raise
+        return [TextContent(type="text", text=text)]
@@ -1,5 +1,6 @@
 """Tool handler modules for the Shipyard Neo MCP server."""
 
+from shipyard_neo_mcp.dispatch import ToolHandler
 from shipyard_neo_mcp.handlers.sandbox import (
     handle_create_sandbox,
     handle_delete_sandbox,
@@ -24,6 +25,7 @@ from shipyard_neo_mcp.handlers.history import (
 )
 from shipyard_neo_mcp.handlers.skills import (
     handle_create_skill_payload,
+    handle_create_skill_payloads,
     handle_get_skill_payload,
     handle_create_skill_candidate,
     handle_evaluate_skill_candidate,
@@ -39,8 +41,11 @@ from shipyard_neo_mcp.handlers.browser import (
     handle_execute_browser_batch,
 )
 from shipyard_neo_mcp.handlers.profiles import handle_list_profiles
+from shipyard_neo_mcp.handlers.batch import handle_batch
 
 __all__ = [
+    "TOOL_HANDLERS",
+    "ToolHandler",
     "handle_create_sandbox",
     "handle_delete_sandbox",
     "handle_execute_python",
@@ -56,6 +61,7 @@ __all__ = [
     "handle_get_last_execution",
     "handle_annotate_execution",
     "handle_create_skill_payload",
+    "handle_create_skill_payloads",
     "handle_get_skill_payload",
     "handle_create_skill_candidate",
     "handle_evaluate_skill_candidate",
@@ -68,10 +74,11 @@ __all__ = [
     "handle_execute_browser",
     "handle_execute_browser_batch",
     "handle_list_profiles",
+    "handle_batch",
 ]
 
 # Handler dispatch table: tool name -> handler function
-TOOL_HANDLERS = {
+TOOL_HANDLERS: dict[str, ToolHandler] = {
     "create_sandbox": handle_create_sandbox,
     "delete_sandbox": handle_delete_sandbox,
     "execute_python": handle_execute_python,
@@ -85,6 +92,7 @@ TOOL_HANDLERS = {
     "get_last_execution": handle_get_last_execution,
     "annotate_execution": handle_annotate_execution,
     "create_skill_payload": handle_create_skill_payload,
+    "create_skill_payloads": handle_create_skill_payloads,
     "get_skill_payload": handle_get_skill_payload,
     "create_skill_candidate": handle_create_skill_candidate,
     "evaluate_skill_candidate": handle_evaluate_skill_candidate,
@@ -99,4 +107,5 @@ TOOL_HANDLERS = {
     "upload_file": handle_upload_file,
     "download_file": handle_download_file,
     "list_profiles": handle_list_profiles,
+    "batch": handle_batch,
 }
@@ -0,0 +1,103 @@
+"""Batch handler: run several tool calls concurrently in one request."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from jsonschema.exceptions import best_match
+from mcp.types import TextContent
+
+from shipyard_neo_mcp.dispatch import format_error
+from shipyard_neo_mcp.tool_defs import get_input_validator
+from shipyard_neo_mcp.validators import read_bool, read_int
+
+# Upper bound on sub-calls accepted by one batch request.
+_MAX_BATCH_CALLS = 20
+
+_SKIPPED = "Skipped: an earlier call in this batch failed."
+
+
+def _read_calls(arguments: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    calls = arguments.get("calls")
+    if not isinstance(calls, list) or not calls:
+        raise ValueError("field 'calls' must be a non-empty array")
+    if len(calls) > _MAX_BATCH_CALLS:
+        raise ValueError(
+            f"field 'calls' must contain at most {_MAX_BATCH_CALLS} entries"
+        )
+    specs: list[tuple[str, dict[str, Any]]] = []
+    for index, call in enumerate(calls):
+        if not isinstance(call, dict):
+            raise ValueError(f"calls[{index}] must be an object")
+        name = call.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"calls[{index}].name must be a non-empty string")
+        if name == "batch":
+            raise ValueError(f"calls[{index}]: batch calls cannot be nested")
+        call_arguments = call.get("arguments", {})
+        if not isinstance(call_arguments, dict):
+            raise ValueError(f"calls[{index}].arguments must be an object")
+        specs.append((name, call_arguments))
+    return specs
+
+
+async def _run_call(name: str, arguments: dict[str, Any]) -> tuple[str, bool]:
+    """Run one sub-call; return its response text and whether it succeeded."""
+    # Imported here: the handler registry imports this module.
+    from shipyard_neo_mcp.handlers import TOOL_HANDLERS
+
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        return f"Unknown tool: {name}", False
+    # Sub-calls skip the server's input validation, so apply it here.
+    validator = get_input_validator(name)
+    if validator is not None and not validator.is_valid(arguments):
+        error = best_match(validator.iter_errors(arguments))
+        return f"Input validation error: {error.message}", False
+    try:
+        result = await handler(arguments)
+    except Exception as e:
+        text = format_error(e, name)
+        if text is None:
+            raise
+        return text, False
+    return "\n\n".join(content.text for content in result), True
+
+
+async def handle_batch(arguments: dict[str, Any]) -> list[TextContent]:
+    """Run independent tool calls concurrently and return one block per call.
+
+    At most ``max_concurrent`` calls run at once, started in input order.
+    A failing call yields its usual error text; with ``stop_on_error`` the
+    calls that have not started yet are skipped.
+    """
+    specs = _read_calls(arguments)
+    max_concurrent = read_int(
+        arguments,
+        "max_concurrent",
+        _MAX_BATCH_CALLS,
+        min_value=1,
+        max_value=_MAX_BATCH_CALLS,
+    )
+    stop_on_error = read_bool(arguments, "stop_on_error", False)
+
+    slots = asyncio.Semaphore(max_concurrent)
+    failed = asyncio.Event()
+
+    async def run(name: str, call_arguments: dict[str, Any]) -> str:
+        async with slots:
+            if stop_on_error and failed.is_set():
+                return _SKIPPED
+            text, ok = await _run_call(name, call_arguments)
+            if not ok:
+                failed.set()
+            return text
+
+    results = await asyncio.gather(
+        *(run(name, call_arguments) for name, call_arguments in specs)
+    )
+    return [
+        TextContent(type="text", text=f"**[{index}] {name}**\n\n{text}")
+        for index, ((name, _), text) in enumerate(zip(specs, results))
+    ]
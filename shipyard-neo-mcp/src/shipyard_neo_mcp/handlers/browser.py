@@ -2,91 +2,117 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from mcp.types import TextContent
 
 from shipyard_neo_mcp import config as _config
 from shipyard_neo_mcp.sandbox_cache import get_sandbox
-from shipyard_neo_mcp.validators import (
-    optional_str,
-    read_bool,
-    read_int,
-    require_str,
-    require_str_list,
-    truncate_text,
-    validate_sandbox_id,
+from shipyard_neo_mcp.timeouts import call_with_timeout
+from shipyard_neo_mcp.validators import build_validator, truncate_parts, truncate_text
+
+_read_browser_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("str", "cmd"),
+    ("int", "timeout", 30, 1, 300),
+    ("optional_str", "description"),
+    ("optional_str", "tags"),
+    ("bool", "learn", False),
+    ("bool", "include_trace", False),
+)
+_read_browser_batch_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("str_list", "commands"),
+    ("int", "timeout", 60, 1, 600),
+    ("bool", "stop_on_error", True),
+    ("optional_str", "description"),
+    ("optional_str", "tags"),
+    ("bool", "learn", False),
+    ("bool", "include_trace", False),
+)
+
+# Constant response fragments; responses are assembled with "".join(parts).
+_BROWSER_HEADER = (
+    "**Browser command {status}** (exit code: {exit_code})\n\n```\n".format
 )
+_STDERR_LABEL = "\n\nstderr:\n"
+_FENCE_END = "\n```"
+# Placeholder for empty output; short enough to skip truncation.
+_NO_OUTPUT = "(no output)"
 
 
 async def handle_execute_browser(arguments: dict[str, Any]) -> list[TextContent]:
     """Execute a single browser automation command in a sandbox."""
-    sandbox_id = validate_sandbox_id(arguments)
-    cmd = require_str(arguments, "cmd")
-    timeout = read_int(arguments, "timeout", 30, min_value=1, max_value=300)
-    description = optional_str(arguments, "description")
-    tags = optional_str(arguments, "tags")
-    learn = read_bool(arguments, "learn", False)
-    include_trace = read_bool(arguments, "include_trace", False)
+    (
+        sandbox_id,
+        cmd,
+        timeout,
+        description,
+        tags,
+        learn,
+        include_trace,
+    ) = _read_browser_args(arguments)
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        result = await sandbox.browser.exec(
+    result = await call_with_timeout(
+        sandbox.browser.exec(
             cmd,
             timeout=timeout,
             description=description,
             tags=tags,
             learn=learn,
             include_trace=include_trace,
-        )
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
-    output = truncate_text(
-        result.output or "(no output)", limit=_config.MAX_TOOL_TEXT_CHARS
+    output = (
+        truncate_parts(result.output, limit=_config.MAX_TOOL_TEXT_CHARS)
+        if result.output
+        else (_NO_OUTPUT,)
     )
-    status = "successful" if result.success else "failed"
-    exit_code = result.exit_code if result.exit_code is not None else "N/A"
-    suffix = ""
+    parts = [
+        _BROWSER_HEADER(
+            status="successful" if result.success else "failed",
+            exit_code=result.exit_code if result.exit_code is not None else "N/A",
+        ),
+        *output,
+        _FENCE_END,
+    ]
     execution_id = getattr(result, "execution_id", None)
     execution_time_ms = getattr(result, "execution_time_ms", None)
     trace_ref = getattr(result, "trace_ref", None)
     if execution_id:
-        suffix += f"\n\nexecution_id: {execution_id}"
+        parts.append(f"\n\nexecution_id: {execution_id}")
     if execution_time_ms is not None:
-        suffix += f"\nexecution_time_ms: {execution_time_ms}"
+        parts.append(f"\nexecution_time_ms: {execution_time_ms}")
     if trace_ref:
-        suffix += f"\ntrace_ref: {trace_ref}"
-    error_suffix = ""
+        parts.append(f"\ntrace_ref: {trace_ref}")
     if not result.success and result.error:
-        error_suffix = f"\n\nstderr:\n{truncate_text(result.error, limit=_config.MAX_TOOL_TEXT_CHARS)}"
-
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"**Browser command {status}** (exit code: {exit_code})\n\n"
-                f"```\n{output}\n```{suffix}{error_suffix}"
-            ),
-        )
-    ]
+        parts.append(_STDERR_LABEL)
+        parts.extend(truncate_parts(result.error, limit=_config.MAX_TOOL_TEXT_CHARS))
+
+    return [TextContent(type="text", text="".join(parts))]
 
 
 async def handle_execute_browser_batch(
     arguments: dict[str, Any],
 ) -> list[TextContent]:
     """Execute a sequence of browser automation commands in one request."""
-    sandbox_id = validate_sandbox_id(arguments)
-    commands = require_str_list(arguments, "commands")
-    timeout = read_int(arguments, "timeout", 60, min_value=1, max_value=600)
-    stop_on_error = read_bool(arguments, "stop_on_error", True)
-    description = optional_str(arguments, "description")
-    tags = optional_str(arguments, "tags")
-    learn = read_bool(arguments, "learn", False)
-    include_trace = read_bool(arguments, "include_trace", False)
+    (
+        sandbox_id,
+        commands,
+        timeout,
+        stop_on_error,
+        description,
+        tags,
+        learn,
+        include_trace,
+    ) = _read_browser_batch_args(arguments)
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        result = await sandbox.browser.exec_batch(
+    result = await call_with_timeout(
+        sandbox.browser.exec_batch(
             commands,
             timeout=timeout,
             stop_on_error=stop_on_error,
@@ -94,7 +120,9 @@ async def handle_execute_browser_batch(
             tags=tags,
             learn=learn,
             include_trace=include_trace,
-        )
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     lines = [
         f"**Batch execution {'completed' if result.success else 'failed'}** "
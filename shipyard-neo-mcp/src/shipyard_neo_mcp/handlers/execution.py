@@ -2,111 +2,132 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from mcp.types import TextContent
 
 from shipyard_neo_mcp import config as _config
 from shipyard_neo_mcp.sandbox_cache import get_sandbox
-from shipyard_neo_mcp.validators import (
-    optional_str,
-    read_bool,
-    read_int,
-    require_str,
-    truncate_text,
-    validate_sandbox_id,
+from shipyard_neo_mcp.timeouts import call_with_timeout
+from shipyard_neo_mcp.validators import build_validator, truncate_parts
+
+# Constant response fragments; responses are assembled with "".join(parts).
+_EXEC_SUCCESS_PREFIX = "**Execution successful**\n\n```\n"
+_EXEC_FAILED_PREFIX = "**Execution failed**\n\n```\n"
+_FENCE_END = "\n```"
+_COMMAND_HEADER = "**Command {status}** (exit code: {exit_code})\n\n```\n".format
+# Placeholders for empty output/error; short enough to skip truncation.
+_NO_OUTPUT = "(no output)"
+_UNKNOWN_ERR = "Unknown error"
+
+_read_python_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("str", "code"),
+    ("int", "timeout", 30, 1, 300),
+    ("bool", "include_code", False),
+    ("optional_str", "description"),
+    ("optional_str", "tags"),
+)
+_read_shell_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("str", "command"),
+    ("optional_str", "cwd"),
+    ("int", "timeout", 30, 1, 300),
+    ("bool", "include_code", False),
+    ("optional_str", "description"),
+    ("optional_str", "tags"),
 )
 
 
 async def handle_execute_python(arguments: dict[str, Any]) -> list[TextContent]:
     """Execute Python code in a sandbox."""
-    sandbox_id = validate_sandbox_id(arguments)
-    code = require_str(arguments, "code")
-    timeout = read_int(arguments, "timeout", 30, min_value=1, max_value=300)
-    include_code = read_bool(arguments, "include_code", False)
-    description = optional_str(arguments, "description")
-    tags = optional_str(arguments, "tags")
+    sandbox_id, code, timeout, include_code, description, tags = _read_python_args(
+        arguments
+    )
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        result = await sandbox.python.exec(
+    result = await call_with_timeout(
+        sandbox.python.exec(
             code,
             timeout=timeout,
             include_code=include_code,
             description=description,
             tags=tags,
-        )
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     if result.success:
-        output = truncate_text(
-            result.output or "(no output)", limit=_config.MAX_TOOL_TEXT_CHARS
+        output = (
+            truncate_parts(result.output, limit=_config.MAX_TOOL_TEXT_CHARS)
+            if result.output
+            else (_NO_OUTPUT,)
         )
-        suffix = ""
+        parts = [_EXEC_SUCCESS_PREFIX, *output, _FENCE_END]
         if result.execution_id:
-            suffix += f"\n\nexecution_id: {result.execution_id}"
+            parts.append(f"\n\nexecution_id: {result.execution_id}")
         if result.execution_time_ms is not None:
-            suffix += f"\nexecution_time_ms: {result.execution_time_ms}"
+            parts.append(f"\nexecution_time_ms: {result.execution_time_ms}")
         if include_code and result.code:
-            suffix += f"\n\ncode:\n{truncate_text(result.code, limit=_config.MAX_TOOL_TEXT_CHARS)}"
-        return [
-            TextContent(
-                type="text",
-                text=f"**Execution successful**\n\n```\n{output}\n```{suffix}",
-            )
-        ]
+            parts.append("\n\ncode:\n")
+            parts.extend(truncate_parts(result.code, limit=_config.MAX_TOOL_TEXT_CHARS))
+        return [TextContent(type="text", text="".join(parts))]
     else:
-        error = truncate_text(
-            result.error or "Unknown error", limit=_config.MAX_TOOL_TEXT_CHARS
+        error = (
+            truncate_parts(result.error, limit=_config.MAX_TOOL_TEXT_CHARS)
+            if result.error
+            else (_UNKNOWN_ERR,)
         )
-        suffix = ""
+        parts = [_EXEC_FAILED_PREFIX, *error, _FENCE_END]
         if result.execution_id:
-            suffix += f"\n\nexecution_id: {result.execution_id}"
-        return [
-            TextContent(
-                type="text",
-                text=f"**Execution failed**\n\n```\n{error}\n```{suffix}",
-            )
-        ]
+            parts.append(f"\n\nexecution_id: {result.execution_id}")
+        return [TextContent(type="text", text="".join(parts))]
 
 
 async def handle_execute_shell(arguments: dict[str, Any]) -> list[TextContent]:
     """Execute a shell command in a sandbox."""
-    sandbox_id = validate_sandbox_id(arguments)
-    command = require_str(arguments, "command")
-    cwd = optional_str(arguments, "cwd")
-    timeout = read_int(arguments, "timeout", 30, min_value=1, max_value=300)
-    include_code = read_bool(arguments, "include_code", False)
-    description = optional_str(arguments, "description")
-    tags = optional_str(arguments, "tags")
+    (
+        sandbox_id,
+        command,
+        cwd,
+        timeout,
+        include_code,
+        description,
+        tags,
+    ) = _read_shell_args(arguments)
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        result = await sandbox.shell.exec(
+    result = await call_with_timeout(
+        sandbox.shell.exec(
             command,
             cwd=cwd,
             timeout=timeout,
             include_code=include_code,
             description=description,
             tags=tags,
-        )
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
-    output = truncate_text(
-        result.output or "(no output)", limit=_config.MAX_TOOL_TEXT_CHARS
+    output = (
+        truncate_parts(result.output, limit=_config.MAX_TOOL_TEXT_CHARS)
+        if result.output
+        else (_NO_OUTPUT,)
     )
-    status = "successful" if result.success else "failed"
-    exit_code = result.exit_code if result.exit_code is not None else "N/A"
-    suffix = ""
+    parts = [
+        _COMMAND_HEADER(
+            status="successful" if result.success else "failed",
+            exit_code=result.exit_code if result.exit_code is not None else "N/A",
+        ),
+        *output,
+        _FENCE_END,
+    ]
     if result.execution_id:
-        suffix += f"\n\nexecution_id: {result.execution_id}"
+        parts.append(f"\n\nexecution_id: {result.execution_id}")
     if result.execution_time_ms is not None:
-        suffix += f"\nexecution_time_ms: {result.execution_time_ms}"
+        parts.append(f"\nexecution_time_ms: {result.execution_time_ms}")
     if include_code and result.command:
-        suffix += f"\n\ncommand:\n{truncate_text(result.command, limit=_config.MAX_TOOL_TEXT_CHARS)}"
+        parts.append("\n\ncommand:\n")
+        parts.extend(truncate_parts(result.command, limit=_config.MAX_TOOL_TEXT_CHARS))
 
-    return [
-        TextContent(
-            type="text",
-            text=f"**Command {status}** (exit code: {exit_code})\n\n```\n{output}\n```{suffix}",
-        )
-    ]
+    return [TextContent(type="text", text="".join(parts))]
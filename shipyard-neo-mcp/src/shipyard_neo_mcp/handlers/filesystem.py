@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from pathlib import Path
 from typing import Any
@@ -11,10 +10,13 @@ from mcp.types import TextContent
 
 from shipyard_neo_mcp import config as _config
 from shipyard_neo_mcp.sandbox_cache import get_sandbox
+from shipyard_neo_mcp.serialization import dumps_json
+from shipyard_neo_mcp.timeouts import call_with_timeout
 from shipyard_neo_mcp.validators import (
     optional_str,
+    read_bool,
     require_str,
-    truncate_text,
+    truncate_parts,
     validate_local_path,
     validate_relative_path,
     validate_sandbox_id,
@@ -29,14 +31,16 @@ async def handle_read_file(arguments: dict[str, Any]) -> list[TextContent]:
     path = validate_relative_path(require_str(arguments, "path"))
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        raw = await sandbox.filesystem.read_file(path)
-    content = truncate_text(raw, limit=_config.MAX_TOOL_TEXT_CHARS)
+    raw = await call_with_timeout(
+        sandbox.filesystem.read_file(path),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    content = truncate_parts(raw, limit=_config.MAX_TOOL_TEXT_CHARS)
 
     return [
         TextContent(
             type="text",
-            text=f"**File: {path}**\n\n```\n{content}\n```",
+            text="".join(("**File: ", path, "**\n\n```\n", *content, "\n```")),
         )
     ]
 
@@ -55,8 +59,10 @@ async def handle_write_file(arguments: dict[str, Any]) -> list[TextContent]:
         )
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        await sandbox.filesystem.write_file(path, content)
+    await call_with_timeout(
+        sandbox.filesystem.write_file(path, content),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     return [
         TextContent(
@@ -75,8 +81,21 @@ async def handle_list_files(arguments: dict[str, Any]) -> list[TextContent]:
     path = validate_relative_path(path)
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        entries = await sandbox.filesystem.list_dir(path)
+    entries = await call_with_timeout(
+        sandbox.filesystem.list_dir(path),
+        _config.SDK_CALL_TIMEOUT,
+    )
+
+    if read_bool(arguments, "as_json", False):
+        listing = [
+            {"name": entry.name, "is_dir": entry.is_dir, "size": entry.size}
+            for entry in entries
+        ]
+        return [
+            TextContent(
+                type="text", text=dumps_json({"path": path, "entries": listing})
+            )
+        ]
 
     if not entries:
         return [
@@ -86,15 +105,20 @@ async def handle_list_files(arguments: dict[str, Any]) -> list[TextContent]:
             )
         ]
 
-    lines = [f"**Directory: {path}**\n"]
-    for entry in entries:
-        if entry.is_dir:
-            lines.append(f"📁 {entry.name}/")
-        else:
-            size = f" ({entry.size} bytes)" if entry.size is not None else ""
-            lines.append(f"📄 {entry.name}{size}")
-
-    return [TextContent(type="text", text="\n".join(lines))]
+    entry_lines = [
+        f"📁 {entry.name}/"
+        if entry.is_dir
+        else f"📄 {entry.name} ({entry.size} bytes)"
+        if entry.size is not None
+        else f"📄 {entry.name}"
+        for entry in entries
+    ]
+    return [
+        TextContent(
+            type="text",
+            text=f"**Directory: {path}**\n\n" + "\n".join(entry_lines),
+        )
+    ]
 
 
 async def handle_delete_file(arguments: dict[str, Any]) -> list[TextContent]:
@@ -103,8 +127,10 @@ async def handle_delete_file(arguments: dict[str, Any]) -> list[TextContent]:
     path = validate_relative_path(require_str(arguments, "path"))
 
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        await sandbox.filesystem.delete(path)
+    await call_with_timeout(
+        sandbox.filesystem.delete(path),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     return [
         TextContent(
@@ -118,7 +144,7 @@ async def handle_upload_file(arguments: dict[str, Any]) -> list[TextContent]:
     """Upload a local file to a sandbox workspace."""
     sandbox_id = validate_sandbox_id(arguments)
     local_path_str = require_str(arguments, "local_path")
-    local_path = validate_local_path(local_path_str)
+    local_path = validate_local_path(local_path_str, resolve=False)
 
     # Determine sandbox target path
     sandbox_path_raw = optional_str(arguments, "sandbox_path")
@@ -144,8 +170,10 @@ async def handle_upload_file(arguments: dict[str, Any]) -> list[TextContent]:
     # Read and upload
     content = local_path.read_bytes()
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        await sandbox.filesystem.upload(sandbox_path, content)
+    await call_with_timeout(
+        sandbox.filesystem.upload(sandbox_path, content),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     logger.info(
         "file_uploaded sandbox_id=%s local=%s sandbox=%s size=%d",
@@ -176,15 +204,17 @@ async def handle_download_file(arguments: dict[str, Any]) -> list[TextContent]:
     # Determine local destination
     local_path_str = optional_str(arguments, "local_path")
     if local_path_str:
-        local_path = validate_local_path(local_path_str)
+        local_path = validate_local_path(local_path_str, resolve=False)
     else:
         # Use sandbox file name in current directory
         local_path = Path.cwd() / Path(sandbox_path).name
 
     # Download from sandbox
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        content = await sandbox.filesystem.download(sandbox_path)
+    content = await call_with_timeout(
+        sandbox.filesystem.download(sandbox_path),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     # Check downloaded size
     if len(content) > _config.MAX_TRANSFER_FILE_BYTES:
@@ -2,77 +2,143 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from mcp.types import TextContent
 
 from shipyard_neo_mcp import config as _config
 from shipyard_neo_mcp.sandbox_cache import get_sandbox
-from shipyard_neo_mcp.validators import (
-    optional_str,
-    read_bool,
-    read_exec_type,
-    read_int,
-    require_str,
-    truncate_text,
-    validate_sandbox_id,
+from shipyard_neo_mcp.timeouts import call_with_timeout
+from shipyard_neo_mcp.validators import build_validator, truncate_text
+
+_read_history_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("exec_type", "exec_type"),
+    ("bool", "success_only", False),
+    ("int", "limit", 50, 1, 500),
+    ("optional_str", "tags"),
+    ("bool", "has_notes", False),
+    ("bool", "has_description", False),
+    ("bool", "include_detail", False),
+)
+_read_execution_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("str", "execution_id"),
+)
+_read_last_execution_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("exec_type", "exec_type"),
+)
+_read_annotate_args = build_validator(
+    ("sandbox_id", "sandbox_id"),
+    ("str", "execution_id"),
+    ("optional_str", "description"),
+    ("optional_str", "tags"),
+    ("optional_str", "notes"),
 )
 
+# Response templates, bound once at import.
+_HISTORY_ROW = "- {id} | {exec_type} | success={success} | {time_ms}ms".format
+_EXECUTION_HEADER = (
+    "execution_id: {id}\ntype: {exec_type}\nsuccess: {success}\ntime_ms: {time_ms}\n"
+)
+_EXECUTION_DETAIL = (
+    _EXECUTION_HEADER + "tags: {tags}\n"
+    "description: {description}\n"
+    "notes: {notes}\n\n"
+    "code:\n{code}\n\n"
+    "output:\n{output}\n\n"
+    "error:\n{error}"
+).format
+_LAST_EXECUTION = (_EXECUTION_HEADER + "code:\n{code}").format
+_ANNOTATED = (
+    "Updated execution {id}\ndescription: {description}\ntags: {tags}\nnotes: {notes}"
+).format
+
 
 async def handle_get_execution_history(
     arguments: dict[str, Any],
 ) -> list[TextContent]:
     """Get execution history for a sandbox with optional filters."""
-    sandbox_id = validate_sandbox_id(arguments)
+    (
+        sandbox_id,
+        exec_type,
+        success_only,
+        limit,
+        tags,
+        has_notes,
+        has_description,
+        include_detail,
+    ) = _read_history_args(arguments)
     sandbox = await get_sandbox(sandbox_id)
 
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        history = await sandbox.get_execution_history(
-            exec_type=read_exec_type(arguments, "exec_type"),
-            success_only=read_bool(arguments, "success_only", False),
-            limit=read_int(arguments, "limit", 50, min_value=1, max_value=500),
-            tags=optional_str(arguments, "tags"),
-            has_notes=read_bool(arguments, "has_notes", False),
-            has_description=read_bool(arguments, "has_description", False),
-        )
+    history = await call_with_timeout(
+        sandbox.get_execution_history(
+            exec_type=exec_type,
+            success_only=success_only,
+            limit=limit,
+            tags=tags,
+            has_notes=has_notes,
+            has_description=has_description,
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     if not history.entries:
         return [TextContent(type="text", text="No execution history found.")]
 
     lines = [f"Total: {history.total}"]
+    # History entries already carry the full record, so detail mode needs
+    # no per-entry get_execution round trips. The text budget is shared
+    # across entries.
+    budget = _config.MAX_TOOL_TEXT_CHARS // len(history.entries)
     for entry in history.entries:
         lines.append(
-            f"- {entry.id} | {entry.exec_type} | success={entry.success} | {entry.execution_time_ms}ms"
+            _HISTORY_ROW(
+                id=entry.id,
+                exec_type=entry.exec_type,
+                success=entry.success,
+                time_ms=entry.execution_time_ms,
+            )
         )
         if entry.description:
             lines.append(f"  description: {entry.description}")
         if entry.tags:
             lines.append(f"  tags: {entry.tags}")
+        if include_detail:
+            if entry.notes:
+                lines.append(f"  notes: {entry.notes}")
+            lines.append(f"  code:\n{truncate_text(entry.code, limit=budget)}")
+            if entry.output:
+                lines.append(f"  output:\n{truncate_text(entry.output, limit=budget)}")
+            if entry.error:
+                lines.append(f"  error:\n{truncate_text(entry.error, limit=budget)}")
     return [TextContent(type="text", text="\n".join(lines))]
 
 
 async def handle_get_execution(arguments: dict[str, Any]) -> list[TextContent]:
     """Get one execution record by execution ID."""
-    sandbox_id = validate_sandbox_id(arguments)
-    execution_id = require_str(arguments, "execution_id")
+    sandbox_id, execution_id = _read_execution_args(arguments)
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        entry = await sandbox.get_execution(execution_id)
+    entry = await call_with_timeout(
+        sandbox.get_execution(execution_id),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    limit = _config.MAX_TOOL_TEXT_CHARS
     return [
         TextContent(
             type="text",
-            text=(
-                f"execution_id: {entry.id}\n"
-                f"type: {entry.exec_type}\n"
-                f"success: {entry.success}\n"
-                f"time_ms: {entry.execution_time_ms}\n"
-                f"tags: {entry.tags or ''}\n"
-                f"description: {entry.description or ''}\n"
-                f"notes: {entry.notes or ''}\n\n"
-                f"code:\n{truncate_text(entry.code, limit=_config.MAX_TOOL_TEXT_CHARS)}\n\n"
-                f"output:\n{truncate_text(entry.output, limit=_config.MAX_TOOL_TEXT_CHARS)}\n\n"
-                f"error:\n{truncate_text(entry.error, limit=_config.MAX_TOOL_TEXT_CHARS)}"
+            text=_EXECUTION_DETAIL(
+                id=entry.id,
+                exec_type=entry.exec_type,
+                success=entry.success,
+                time_ms=entry.execution_time_ms,
+                tags=entry.tags or "",
+                description=entry.description or "",
+                notes=entry.notes or "",
+                code=truncate_text(entry.code, limit=limit),
+                output=truncate_text(entry.output, limit=limit),
+                error=truncate_text(entry.error, limit=limit),
             ),
         )
     ]
@@ -82,21 +148,21 @@ async def handle_get_last_execution(
     arguments: dict[str, Any],
 ) -> list[TextContent]:
     """Get the latest execution record in a sandbox."""
-    sandbox_id = validate_sandbox_id(arguments)
+    sandbox_id, exec_type = _read_last_execution_args(arguments)
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        entry = await sandbox.get_last_execution(
-            exec_type=read_exec_type(arguments, "exec_type")
-        )
+    entry = await call_with_timeout(
+        sandbox.get_last_execution(exec_type=exec_type),
+        _config.SDK_CALL_TIMEOUT,
+    )
     return [
         TextContent(
             type="text",
-            text=(
-                f"execution_id: {entry.id}\n"
-                f"type: {entry.exec_type}\n"
-                f"success: {entry.success}\n"
-                f"time_ms: {entry.execution_time_ms}\n"
-                f"code:\n{truncate_text(entry.code, limit=_config.MAX_TOOL_TEXT_CHARS)}"
+            text=_LAST_EXECUTION(
+                id=entry.id,
+                exec_type=entry.exec_type,
+                success=entry.success,
+                time_ms=entry.execution_time_ms,
+                code=truncate_text(entry.code, limit=_config.MAX_TOOL_TEXT_CHARS),
             ),
         )
     ]
@@ -106,24 +172,25 @@ async def handle_annotate_execution(
     arguments: dict[str, Any],
 ) -> list[TextContent]:
     """Add or update description/tags/notes for one execution record."""
-    sandbox_id = validate_sandbox_id(arguments)
-    execution_id = require_str(arguments, "execution_id")
+    sandbox_id, execution_id, description, tags, notes = _read_annotate_args(arguments)
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        entry = await sandbox.annotate_execution(
+    entry = await call_with_timeout(
+        sandbox.annotate_execution(
             execution_id,
-            description=optional_str(arguments, "description"),
-            tags=optional_str(arguments, "tags"),
-            notes=optional_str(arguments, "notes"),
-        )
+            description=description,
+            tags=tags,
+            notes=notes,
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
     return [
         TextContent(
             type="text",
-            text=(
-                f"Updated execution {entry.id}\n"
-                f"description: {entry.description or ''}\n"
-                f"tags: {entry.tags or ''}\n"
-                f"notes: {entry.notes or ''}"
+            text=_ANNOTATED(
+                id=entry.id,
+                description=entry.description or "",
+                tags=entry.tags or "",
+                notes=entry.notes or "",
             ),
         )
     ]
@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from mcp.types import TextContent
 
 from shipyard_neo_mcp import config as _config
 from shipyard_neo_mcp.sandbox_cache import get_client
+from shipyard_neo_mcp.timeouts import call_with_timeout
 
 
 async def handle_list_profiles(arguments: dict[str, Any]) -> list[TextContent]:
     """List available sandbox profiles."""
     client = get_client()
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        profiles = await client.list_profiles(detail=True)
+    profiles = await call_with_timeout(
+        client.list_profiles(detail=True),
+        _config.SDK_CALL_TIMEOUT,
+    )
 
     if not profiles.items:
         return [TextContent(type="text", text="No profiles available.")]
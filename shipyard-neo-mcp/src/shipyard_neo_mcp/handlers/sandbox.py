@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from functools import partial
 from typing import Any
 
 from mcp.types import TextContent
@@ -11,27 +15,164 @@ from mcp.types import TextContent
 from shipyard_neo_mcp import config as _config
 from shipyard_neo_mcp.sandbox_cache import (
     cache_sandbox,
+    discard_sandbox,
     get_client,
     get_sandbox,
     _get_lock,
-    _sandboxes,
 )
+from shipyard_neo_mcp.timeouts import call_with_timeout
 from shipyard_neo_mcp.validators import read_int, validate_sandbox_id
 
 logger = logging.getLogger("shipyard_neo_mcp")
 
+# (client, config, bound create call, ttl) for argument-less create_sandbox
+# calls. Rebuilt whenever the client or the loaded config changes.
+_default_create: (
+    tuple[Any, Mapping[str, Any], Callable[[], Awaitable[Any]], int] | None
+) = None
+
+# (bound default create call, task) creating a default sandbox in the
+# background; see start_prewarm. Consumed by the first argument-less
+# create_sandbox call made with the same client and config.
+_prewarm: tuple[Callable[[], Awaitable[Any]], asyncio.Future[Any]] | None = None
+
+# Background deletions of prewarmed sandboxes nobody will use; awaited by
+# aclose_prewarm so shutdown does not leave them behind.
+_discards: set[asyncio.Future[None]] = set()
+
+# A prewarmed sandbox is only handed out while at least this share of its
+# TTL is left; an older one is deleted and a fresh sandbox created instead.
+_PREWARM_MIN_TTL_LEFT = 0.5
+
+# Response template for create_sandbox, bound once at import.
+_SANDBOX_CREATED = (
+    "Sandbox created successfully.\n\n"
+    "**Sandbox ID:** `{id}`\n"
+    "**Profile:** {profile}\n"
+    "**Status:** {status}\n"
+    "**Capabilities:** {capabilities}\n"
+    "**TTL:** {ttl} seconds\n"
+    "{containers}\n"
+    "Use this sandbox_id for subsequent operations."
+).format
+
+
+def _get_default_create(client: Any) -> tuple[Callable[[], Awaitable[Any]], int]:
+    """Return ``client.create_sandbox`` pre-bound to the configured defaults."""
+    global _default_create
+    config = _config.get_config()
+    cached = _default_create
+    if cached is None or cached[0] is not client or cached[1] is not config:
+        ttl = config["default_ttl"]
+        create = partial(
+            client.create_sandbox, profile=config["default_profile"], ttl=ttl
+        )
+        cached = _default_create = (client, config, create, ttl)
+    return cached[2], cached[3]
+
+
+def start_prewarm(client: Any) -> None:
+    """Start creating a default sandbox in the background.
+
+    Lets the first argument-less ``create_sandbox`` call skip most of the
+    provisioning wait. Only used when ``SHIPYARD_PREWARM_SANDBOX`` is set.
+    """
+    global _prewarm
+    create, _ = _get_default_create(client)
+    _prewarm = (create, asyncio.ensure_future(create()))
+
+
+async def aclose_prewarm() -> None:
+    """Delete the sandbox of an unused prewarm and wait for pending deletions."""
+    global _prewarm
+    if _prewarm is not None:
+        _discard_prewarm(_prewarm[1])
+        _prewarm = None
+    if _discards:
+        await asyncio.gather(*_discards, return_exceptions=True)
+
+
+async def _delete_when_created(task: asyncio.Future[Any]) -> None:
+    """Wait for a prewarm create call, then delete the sandbox it made."""
+    try:
+        sandbox = await task
+    except Exception:
+        return
+    with contextlib.suppress(Exception):
+        await call_with_timeout(sandbox.delete(), _config.SDK_CALL_TIMEOUT)
+
+
+def _discard_prewarm(task: asyncio.Future[Any]) -> None:
+    """Delete the result of ``task`` in the background, without cancelling it.
+
+    Cancelling an in-flight create would not stop Bay from creating the
+    sandbox, only lose the handle needed to delete it.
+    """
+    deletion = asyncio.ensure_future(_delete_when_created(task))
+    _discards.add(deletion)
+    deletion.add_done_callback(_discards.discard)
+
+
+def _ttl_left(sandbox: Any, ttl: int) -> int | None:
+    """Seconds of TTL a prewarmed sandbox has left, or None if too few."""
+    expires_at = getattr(sandbox, "expires_at", None)
+    if expires_at is None:
+        return ttl
+    left = int(expires_at.timestamp() - time.time())
+    return left if left >= ttl * _PREWARM_MIN_TTL_LEFT else None
+
+
+async def _create_default(
+    create: Callable[[], Awaitable[Any]], ttl: int
+) -> tuple[Any, int]:
+    """Create a default sandbox, preferring the one prewarmed by ``create``.
+
+    Returns the sandbox and the TTL it has left. Meant to run under a single
+    ``call_with_timeout`` so waiting on the prewarm and creating a
+    replacement share one deadline.
+    """
+    global _prewarm
+    if _prewarm is not None and _prewarm[0] is create:
+        task = _prewarm[1]
+        _prewarm = None
+        try:
+            sandbox = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Deadline hit (or caller gone): the prewarm keeps running and
+            # its sandbox is deleted once created.
+            _discard_prewarm(task)
+            raise
+        except Exception as e:
+            logger.warning("sandbox_prewarm_failed error=%s", e)
+        else:
+            left = _ttl_left(sandbox, ttl)
+            if left is not None:
+                return sandbox, left
+            logger.info("sandbox_prewarm_stale sandbox_id=%s", sandbox.id)
+            _discard_prewarm(task)
+    return await create(), ttl
+
 
 async def handle_create_sandbox(arguments: dict[str, Any]) -> list[TextContent]:
     """Create a new sandbox environment."""
     client = get_client()
-    config = _config.get_config()
-    profile = arguments.get("profile", config["default_profile"])
-    if not isinstance(profile, str) or not profile.strip():
-        raise ValueError("field 'profile' must be a non-empty string")
-    ttl = read_int(arguments, "ttl", config["default_ttl"], min_value=0)
-
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        sandbox = await client.create_sandbox(profile=profile, ttl=ttl)
+    if arguments:
+        config = _config.get_config()
+        profile = arguments.get("profile", config["default_profile"])
+        if not isinstance(profile, str) or not profile.strip():
+            raise ValueError("field 'profile' must be a non-empty string")
+        ttl = read_int(arguments, "ttl", config["default_ttl"], min_value=0)
+        sandbox = await call_with_timeout(
+            client.create_sandbox(profile=profile, ttl=ttl),
+            _config.SDK_CALL_TIMEOUT,
+        )
+    else:
+        # Common case: no overrides, so reuse the pre-bound default call,
+        # or the sandbox it already started creating at startup.
+        create, ttl = _get_default_create(client)
+        sandbox, ttl = await call_with_timeout(
+            _create_default(create, ttl), _config.SDK_CALL_TIMEOUT
+        )
     async with _get_lock():
         cache_sandbox(sandbox)
 
@@ -59,14 +200,14 @@ async def handle_create_sandbox(arguments: dict[str, Any]) -> list[TextContent]:
     return [
         TextContent(
             type="text",
-            text=f"Sandbox created successfully.\n\n"
-            f"**Sandbox ID:** `{sandbox.id}`\n"
-            f"**Profile:** {sandbox.profile}\n"
-            f"**Status:** {sandbox.status.value}\n"
-            f"**Capabilities:** {', '.join(sandbox.capabilities)}\n"
-            f"**TTL:** {ttl} seconds\n"
-            f"{containers_text}\n"
-            f"Use this sandbox_id for subsequent operations.",
+            text=_SANDBOX_CREATED(
+                id=sandbox.id,
+                profile=sandbox.profile,
+                status=sandbox.status.value,
+                capabilities=", ".join(sandbox.capabilities),
+                ttl=ttl,
+                containers=containers_text,
+            ),
         )
     ]
 
@@ -75,10 +216,12 @@ async def handle_delete_sandbox(arguments: dict[str, Any]) -> list[TextContent]:
     """Delete a sandbox and clean up resources."""
     sandbox_id = validate_sandbox_id(arguments)
     sandbox = await get_sandbox(sandbox_id)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        await sandbox.delete()
+    await call_with_timeout(
+        sandbox.delete(),
+        _config.SDK_CALL_TIMEOUT,
+    )
     async with _get_lock():
-        _sandboxes.pop(sandbox_id, None)
+        discard_sandbox(sandbox_id)
 
     logger.info("sandbox_deleted sandbox_id=%s", sandbox_id)
 
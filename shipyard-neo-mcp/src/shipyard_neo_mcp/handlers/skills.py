@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import sys
+from enum import Enum
+from itertools import chain
 from typing import Any
 
 from mcp.types import TextContent
 
 from shipyard_neo_mcp import config as _config
+from shipyard_neo_mcp import payload_cache
+from shipyard_neo_mcp.dispatch import format_error
 from shipyard_neo_mcp.sandbox_cache import get_client
+from shipyard_neo_mcp.serialization import dumps_capped, dumps_json
+from shipyard_neo_mcp.timeouts import call_with_timeout
 from shipyard_neo_mcp.validators import (
     optional_str,
     read_bool,
@@ -18,9 +24,76 @@ from shipyard_neo_mcp.validators import (
     read_release_stage,
     require_str,
     require_str_list,
-    truncate_text,
 )
 
+# Upper bound on entries accepted by create_skill_payloads in one call.
+_MAX_PAYLOAD_BATCH = 50
+
+# Row templates for the listing tools, bound once at import.
+_CANDIDATE_ROW = "- {id} | {skill_key} | status={status} | pass={passed}".format
+_RELEASE_ROW = (
+    "- {id} | {skill_key} v{version} | stage={stage} | active={active}".format
+)
+
+# Enum member -> interned ``.value`` string, shared by every rendered row.
+_ENUM_STR: dict[Enum, str] = {}
+
+
+def _enum_str(member: Enum) -> str:
+    text = _ENUM_STR.get(member)
+    if text is None:
+        text = _ENUM_STR[member] = sys.intern(str(member.value))
+    return text
+
+
+def _text(text: str) -> list[TextContent]:
+    """Wrap one response string in the single-item list MCP expects."""
+    return [TextContent(type="text", text=text)]
+
+
+# Shared responses for empty listings; callers get a fresh list around them.
+_NO_CANDIDATES = TextContent(type="text", text="No skill candidates found.")
+_NO_RELEASES = TextContent(type="text", text="No skill releases found.")
+
+# Response templates for the single-record tools.
+_PAYLOAD_CREATED = "Created skill payload {payload_ref}\nkind: {kind}".format
+_PAYLOAD_DETAIL = "payload_ref: {payload_ref}\nkind: {kind}\npayload:\n{payload}".format
+_CANDIDATE_CREATED = (
+    "Created skill candidate {id}\n"
+    "skill_key: {skill_key}\n"
+    "status: {status}\n"
+    "source_execution_ids: {source_execution_ids}"
+).format
+_EVALUATION_RECORDED = (
+    "Evaluation recorded: {id}\n"
+    "candidate_id: {candidate_id}\n"
+    "passed: {passed}\n"
+    "score: {score}"
+).format
+_CANDIDATE_PROMOTED = (
+    "Candidate promoted: {candidate_id}\n"
+    "release_id: {release_id}\n"
+    "skill_key: {skill_key}\n"
+    "version: {version}\n"
+    "stage: {stage}\n"
+    "active: {active}\n"
+    "upgrade_of_release_id: {upgrade_of_release_id}\n"
+    "upgrade_reason: {upgrade_reason}"
+).format
+_DELETED = (
+    "Skill {what} deleted: {target_id}\n"
+    "deleted_at: {deleted_at}\n"
+    "deleted_by: {deleted_by}\n"
+    "delete_reason: {delete_reason}"
+).format
+_ROLLBACK_COMPLETED = (
+    "Rollback completed.\n"
+    "new_release_id: {id}\n"
+    "skill_key: {skill_key}\n"
+    "version: {version}\n"
+    "rollback_of: {rollback_of}"
+).format
+
 
 async def handle_create_skill_payload(
     arguments: dict[str, Any],
@@ -31,35 +104,84 @@ async def handle_create_skill_payload(
     if not isinstance(payload, (dict, list)):
         raise ValueError("field 'payload' must be a JSON object or array")
     kind = optional_str(arguments, "kind") or "generic"
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        result = await client.skills.create_payload(payload=payload, kind=kind)
-    return [
-        TextContent(
-            type="text",
-            text=(f"Created skill payload {result.payload_ref}\nkind: {result.kind}"),
+    result = await call_with_timeout(
+        client.skills.create_payload(payload=payload, kind=kind),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    return _text(_PAYLOAD_CREATED(payload_ref=result.payload_ref, kind=result.kind))
+
+
+async def handle_create_skill_payloads(
+    arguments: dict[str, Any],
+) -> list[TextContent]:
+    """Create several skill payloads concurrently and return their payload_refs."""
+    client = get_client()
+    items = arguments.get("items")
+    if not isinstance(items, list) or not items:
+        raise ValueError("field 'items' must be a non-empty array")
+    if len(items) > _MAX_PAYLOAD_BATCH:
+        raise ValueError(
+            f"field 'items' must contain at most {_MAX_PAYLOAD_BATCH} entries"
         )
-    ]
+    specs: list[tuple[Any, str]] = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"items[{index}] must be an object")
+        payload = item.get("payload")
+        if not isinstance(payload, (dict, list)):
+            raise ValueError(f"items[{index}].payload must be a JSON object or array")
+        kind = item.get("kind")
+        if kind is not None and not isinstance(kind, str):
+            raise ValueError(f"items[{index}].kind must be a string")
+        specs.append((payload, kind or "generic"))
+
+    # Each item gets its own timeout and failure, so the refs of payloads
+    # that were created are reported even when others fail.
+    results = await asyncio.gather(
+        *(
+            call_with_timeout(
+                client.skills.create_payload(payload=payload, kind=kind),
+                _config.SDK_CALL_TIMEOUT,
+            )
+            for payload, kind in specs
+        ),
+        return_exceptions=True,
+    )
+    lines = [""]
+    created = 0
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            lines.append(
+                f"items[{index}]\t{format_error(result, 'create_skill_payloads')}"
+            )
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            created += 1
+            lines.append(f"{result.payload_ref}\t{result.kind}")
+    failed = len(results) - created
+    lines[0] = f"Created {created} skill payloads" + (
+        f", {failed} failed (payload_ref\tkind, or items[i]\terror):"
+        if failed
+        else " (payload_ref\tkind):"
+    )
+    return _text("\n".join(lines))
 
 
 async def handle_get_skill_payload(
     arguments: dict[str, Any],
 ) -> list[TextContent]:
     """Get one skill payload by payload_ref."""
-    client = get_client()
     payload_ref = require_str(arguments, "payload_ref")
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        result = await client.skills.get_payload(payload_ref)
-    payload_json = json.dumps(result.payload, ensure_ascii=False, default=str)
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"payload_ref: {result.payload_ref}\n"
-                f"kind: {result.kind}\n"
-                f"payload:\n{truncate_text(payload_json, limit=_config.MAX_TOOL_TEXT_CHARS)}"
-            ),
+    result = await payload_cache.get_payload(payload_ref)
+    payload_json = dumps_capped(result.payload, limit=_config.MAX_TOOL_TEXT_CHARS)
+    return _text(
+        _PAYLOAD_DETAIL(
+            payload_ref=result.payload_ref,
+            kind=result.kind,
+            payload=payload_json,
         )
-    ]
+    )
 
 
 async def handle_create_skill_candidate(
@@ -69,36 +191,31 @@ async def handle_create_skill_candidate(
     client = get_client()
     skill_key = require_str(arguments, "skill_key")
     source_execution_ids = require_str_list(arguments, "source_execution_ids")
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        candidate = await client.skills.create_candidate(
+    preconditions = arguments.get("preconditions")
+    postconditions = arguments.get("postconditions")
+    candidate = await call_with_timeout(
+        client.skills.create_candidate(
             skill_key=skill_key,
             source_execution_ids=source_execution_ids,
             scenario_key=optional_str(arguments, "scenario_key"),
             payload_ref=optional_str(arguments, "payload_ref"),
             summary=optional_str(arguments, "summary"),
             usage_notes=optional_str(arguments, "usage_notes"),
-            preconditions=(
-                arguments.get("preconditions")
-                if isinstance(arguments.get("preconditions"), dict)
-                else None
-            ),
+            preconditions=(preconditions if isinstance(preconditions, dict) else None),
             postconditions=(
-                arguments.get("postconditions")
-                if isinstance(arguments.get("postconditions"), dict)
-                else None
-            ),
-        )
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"Created skill candidate {candidate.id}\n"
-                f"skill_key: {candidate.skill_key}\n"
-                f"status: {candidate.status.value}\n"
-                f"source_execution_ids: {', '.join(candidate.source_execution_ids)}"
+                postconditions if isinstance(postconditions, dict) else None
             ),
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    return _text(
+        _CANDIDATE_CREATED(
+            id=candidate.id,
+            skill_key=candidate.skill_key,
+            status=_enum_str(candidate.status),
+            source_execution_ids=", ".join(candidate.source_execution_ids),
         )
-    ]
+    )
 
 
 async def handle_evaluate_skill_candidate(
@@ -110,25 +227,24 @@ async def handle_evaluate_skill_candidate(
     passed = arguments.get("passed")
     if not isinstance(passed, bool):
         raise ValueError("field 'passed' must be a boolean")
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        evaluation = await client.skills.evaluate_candidate(
+    evaluation = await call_with_timeout(
+        client.skills.evaluate_candidate(
             candidate_id,
             passed=passed,
             score=read_optional_number(arguments, "score"),
             benchmark_id=optional_str(arguments, "benchmark_id"),
             report=optional_str(arguments, "report"),
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    return _text(
+        _EVALUATION_RECORDED(
+            id=evaluation.id,
+            candidate_id=evaluation.candidate_id,
+            passed=evaluation.passed,
+            score=evaluation.score,
         )
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"Evaluation recorded: {evaluation.id}\n"
-                f"candidate_id: {evaluation.candidate_id}\n"
-                f"passed: {evaluation.passed}\n"
-                f"score: {evaluation.score}"
-            ),
-        )
-    ]
+    )
 
 
 async def handle_promote_skill_candidate(
@@ -137,29 +253,28 @@ async def handle_promote_skill_candidate(
     """Promote a passing skill candidate to release."""
     client = get_client()
     candidate_id = require_str(arguments, "candidate_id")
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        release = await client.skills.promote_candidate(
+    release = await call_with_timeout(
+        client.skills.promote_candidate(
             candidate_id,
             stage=read_release_stage(arguments, key="stage", default="canary"),
             upgrade_of_release_id=optional_str(arguments, "upgrade_of_release_id"),
             upgrade_reason=optional_str(arguments, "upgrade_reason"),
             change_summary=optional_str(arguments, "change_summary"),
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    return _text(
+        _CANDIDATE_PROMOTED(
+            candidate_id=candidate_id,
+            release_id=release.id,
+            skill_key=release.skill_key,
+            version=release.version,
+            stage=_enum_str(release.stage),
+            active=release.is_active,
+            upgrade_of_release_id=getattr(release, "upgrade_of_release_id", None),
+            upgrade_reason=getattr(release, "upgrade_reason", None),
         )
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"Candidate promoted: {candidate_id}\n"
-                f"release_id: {release.id}\n"
-                f"skill_key: {release.skill_key}\n"
-                f"version: {release.version}\n"
-                f"stage: {release.stage.value}\n"
-                f"active: {release.is_active}\n"
-                f"upgrade_of_release_id: {getattr(release, 'upgrade_of_release_id', None)}\n"
-                f"upgrade_reason: {getattr(release, 'upgrade_reason', None)}"
-            ),
-        )
-    ]
+    )
 
 
 async def handle_list_skill_candidates(
@@ -167,21 +282,49 @@ async def handle_list_skill_candidates(
 ) -> list[TextContent]:
     """List skill candidates with optional filters."""
     client = get_client()
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        candidates = await client.skills.list_candidates(
+    candidates = await call_with_timeout(
+        client.skills.list_candidates(
             status=optional_str(arguments, "status"),
             skill_key=optional_str(arguments, "skill_key"),
             limit=read_int(arguments, "limit", 50, min_value=1, max_value=500),
             offset=read_int(arguments, "offset", 0, min_value=0),
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    if read_bool(arguments, "as_json", False):
+        return _text(
+            dumps_json(
+                {
+                    "total": candidates.total,
+                    "items": [
+                        {
+                            "id": item.id,
+                            "skill_key": item.skill_key,
+                            "status": _enum_str(item.status),
+                            "latest_pass": item.latest_pass,
+                        }
+                        for item in candidates.items
+                    ],
+                }
+            )
         )
     if not candidates.items:
-        return [TextContent(type="text", text="No skill candidates found.")]
-    lines = [f"Total: {candidates.total}"]
-    for item in candidates.items:
-        lines.append(
-            f"- {item.id} | {item.skill_key} | status={item.status.value} | pass={item.latest_pass}"
+        return [_NO_CANDIDATES]
+    text = "\n".join(
+        chain(
+            [f"Total: {candidates.total}"],
+            (
+                _CANDIDATE_ROW(
+                    id=item.id,
+                    skill_key=item.skill_key,
+                    status=_enum_str(item.status),
+                    passed=item.latest_pass,
+                )
+                for item in candidates.items
+            ),
         )
-    return [TextContent(type="text", text="\n".join(lines))]
+    )
+    return _text(text)
 
 
 async def handle_list_skill_releases(
@@ -189,8 +332,8 @@ async def handle_list_skill_releases(
 ) -> list[TextContent]:
     """List skill releases with optional filters."""
     client = get_client()
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        releases = await client.skills.list_releases(
+    releases = await call_with_timeout(
+        client.skills.list_releases(
             skill_key=optional_str(arguments, "skill_key"),
             active_only=read_bool(arguments, "active_only", False),
             stage=read_release_stage(
@@ -198,15 +341,45 @@ async def handle_list_skill_releases(
             ),
             limit=read_int(arguments, "limit", 50, min_value=1, max_value=500),
             offset=read_int(arguments, "offset", 0, min_value=0),
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    if read_bool(arguments, "as_json", False):
+        return _text(
+            dumps_json(
+                {
+                    "total": releases.total,
+                    "items": [
+                        {
+                            "id": item.id,
+                            "skill_key": item.skill_key,
+                            "version": item.version,
+                            "stage": _enum_str(item.stage),
+                            "is_active": item.is_active,
+                        }
+                        for item in releases.items
+                    ],
+                }
+            )
         )
     if not releases.items:
-        return [TextContent(type="text", text="No skill releases found.")]
-    lines = [f"Total: {releases.total}"]
-    for item in releases.items:
-        lines.append(
-            f"- {item.id} | {item.skill_key} v{item.version} | stage={item.stage.value} | active={item.is_active}"
+        return [_NO_RELEASES]
+    text = "\n".join(
+        chain(
+            [f"Total: {releases.total}"],
+            (
+                _RELEASE_ROW(
+                    id=item.id,
+                    skill_key=item.skill_key,
+                    version=item.version,
+                    stage=_enum_str(item.stage),
+                    active=item.is_active,
+                )
+                for item in releases.items
+            ),
         )
-    return [TextContent(type="text", text="\n".join(lines))]
+    )
+    return _text(text)
 
 
 async def handle_delete_skill_release(
@@ -215,22 +388,22 @@ async def handle_delete_skill_release(
     """Soft-delete one inactive skill release."""
     client = get_client()
     release_id = require_str(arguments, "release_id")
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        deleted = await client.skills.delete_release(
+    deleted = await call_with_timeout(
+        client.skills.delete_release(
             release_id,
             reason=optional_str(arguments, "reason"),
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    return _text(
+        _DELETED(
+            what="release",
+            target_id=release_id,
+            deleted_at=deleted.get("deleted_at"),
+            deleted_by=deleted.get("deleted_by"),
+            delete_reason=deleted.get("delete_reason"),
         )
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"Skill release deleted: {release_id}\n"
-                f"deleted_at: {deleted.get('deleted_at')}\n"
-                f"deleted_by: {deleted.get('deleted_by')}\n"
-                f"delete_reason: {deleted.get('delete_reason')}"
-            ),
-        )
-    ]
+    )
 
 
 async def handle_delete_skill_candidate(
@@ -239,22 +412,22 @@ async def handle_delete_skill_candidate(
     """Soft-delete one skill candidate."""
     client = get_client()
     candidate_id = require_str(arguments, "candidate_id")
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        deleted = await client.skills.delete_candidate(
+    deleted = await call_with_timeout(
+        client.skills.delete_candidate(
             candidate_id,
             reason=optional_str(arguments, "reason"),
+        ),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    return _text(
+        _DELETED(
+            what="candidate",
+            target_id=candidate_id,
+            deleted_at=deleted.get("deleted_at"),
+            deleted_by=deleted.get("deleted_by"),
+            delete_reason=deleted.get("delete_reason"),
         )
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"Skill candidate deleted: {candidate_id}\n"
-                f"deleted_at: {deleted.get('deleted_at')}\n"
-                f"deleted_by: {deleted.get('deleted_by')}\n"
-                f"delete_reason: {deleted.get('delete_reason')}"
-            ),
-        )
-    ]
+    )
 
 
 async def handle_rollback_skill_release(
@@ -263,17 +436,15 @@ async def handle_rollback_skill_release(
     """Rollback an active release to a previous known-good version."""
     client = get_client()
     release_id = require_str(arguments, "release_id")
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        rollback_release = await client.skills.rollback_release(release_id)
-    return [
-        TextContent(
-            type="text",
-            text=(
-                f"Rollback completed.\n"
-                f"new_release_id: {rollback_release.id}\n"
-                f"skill_key: {rollback_release.skill_key}\n"
-                f"version: {rollback_release.version}\n"
-                f"rollback_of: {rollback_release.rollback_of}"
-            ),
+    rollback_release = await call_with_timeout(
+        client.skills.rollback_release(release_id),
+        _config.SDK_CALL_TIMEOUT,
+    )
+    return _text(
+        _ROLLBACK_COMPLETED(
+            id=rollback_release.id,
+            skill_key=rollback_release.skill_key,
+            version=rollback_release.version,
+            rollback_of=rollback_release.rollback_of,
         )
-    ]
+    )
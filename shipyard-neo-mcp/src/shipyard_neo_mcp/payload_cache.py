@@ -0,0 +1,70 @@
+"""Short-lived cache for skill payload reads."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from shipyard_neo_mcp import config as _config
+from shipyard_neo_mcp.sandbox_cache import get_client
+from shipyard_neo_mcp.timeouts import call_with_timeout
+
+# payload_ref -> (expires_at, payload). Insertion order is recency order.
+_payloads: dict[str, tuple[float, Any]] = {}
+# payload_ref -> in-flight fetch shared by concurrent callers.
+_inflight: dict[str, asyncio.Future[Any]] = {}
+# Clock used for expiry; a module attribute so tests can substitute it.
+_clock = time.monotonic
+
+
+def clear() -> None:
+    """Drop all cached payloads and forget in-flight fetches."""
+    _payloads.clear()
+    _inflight.clear()
+
+
+async def aclose() -> None:
+    """Clear the cache and cancel any fetches still in flight."""
+    pending = list(_inflight.values())
+    clear()
+    for fetch in pending:
+        fetch.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def get_payload(payload_ref: str) -> Any:
+    """Return a skill payload by ref, serving repeats from a TTL/LRU cache.
+
+    Concurrent misses for the same ref share one SDK call.
+    """
+    entry = _payloads.pop(payload_ref, None)
+    if entry is not None and entry[0] > _clock():
+        _payloads[payload_ref] = entry
+        return entry[1]
+
+    pending = _inflight.get(payload_ref)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    fetch = asyncio.ensure_future(
+        call_with_timeout(
+            get_client().skills.get_payload(payload_ref),
+            _config.SDK_CALL_TIMEOUT,
+        )
+    )
+    _inflight[payload_ref] = fetch
+    try:
+        result = await asyncio.shield(fetch)
+    finally:
+        if _inflight.get(payload_ref) is fetch:
+            del _inflight[payload_ref]
+
+    _payloads[payload_ref] = (
+        _clock() + _config.SKILL_PAYLOAD_CACHE_TTL,
+        result,
+    )
+    while len(_payloads) > _config.SKILL_PAYLOAD_CACHE_SIZE:
+        del _payloads[next(iter(_payloads))]
+    return result
@@ -4,17 +4,36 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import OrderedDict
+import time
+import weakref
 from typing import Any
 
 from shipyard_neo_mcp import config as _config
+from shipyard_neo_mcp.timeouts import call_with_timeout
 
 logger = logging.getLogger("shipyard_neo_mcp")
 
 # Global client instance (managed by lifespan)
 _client: Any = None
-_sandboxes: OrderedDict[str, Any] = OrderedDict()
+# Plain dict used as an LRU: insertion order is recency order, so a hit is
+# moved to the end by popping and re-inserting it.
+_sandboxes: dict[str, Any] = {}
 _sandboxes_lock: asyncio.Lock | None = None
+# Weak index over every sandbox handed out. The LRU above holds the strong
+# references; an evicted sandbox stays reachable here only while a tool
+# call still uses it, and is dropped once it is garbage-collected.
+_live_sandboxes: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+# sandbox_id -> lock held while that id is being fetched, so concurrent
+# misses for one id share a single get_sandbox RPC.
+_fetch_locks: dict[str, asyncio.Lock] = {}
+# sandbox_id -> number of callers holding or queued on its fetch lock. The
+# lock is dropped only when this reaches zero: a released lock reads as
+# unlocked before the next queued caller has taken it, so locked() alone
+# would let a newcomer create a second lock and fetch in parallel.
+_fetch_waiters: dict[str, int] = {}
+
+# Sentinel for single-lookup cache probes.
+_MISS = object()
 
 
 def _get_lock() -> asyncio.Lock:
@@ -30,16 +49,27 @@ def cache_sandbox(sandbox: Any) -> None:
     sandbox_id = getattr(sandbox, "id", None)
     if not isinstance(sandbox_id, str) or not sandbox_id:
         return
-    if sandbox_id in _sandboxes:
-        _sandboxes.move_to_end(sandbox_id)
+    _sandboxes.pop(sandbox_id, None)
     _sandboxes[sandbox_id] = sandbox
+    try:
+        _live_sandboxes[sandbox_id] = sandbox
+    except TypeError:
+        # Objects without ``__weakref__`` are only tracked by the LRU.
+        pass
     while len(_sandboxes) > _config.MAX_SANDBOX_CACHE_SIZE:
-        evicted_id, _ = _sandboxes.popitem(last=False)
+        evicted_id = next(iter(_sandboxes))
+        del _sandboxes[evicted_id]
         logger.debug(
             "cache_evict sandbox_id=%s cache_size=%d", evicted_id, len(_sandboxes)
         )
 
 
+def _is_expired(sandbox: Any) -> bool:
+    """Whether a cached sandbox is past its ``expires_at`` (TTL) deadline."""
+    expires_at = getattr(sandbox, "expires_at", None)
+    return expires_at is not None and expires_at.timestamp() <= time.time()
+
+
 def set_client(client: Any) -> None:
     """Set the global BayClient instance."""
     global _client
@@ -51,26 +81,69 @@ def get_client() -> Any:
     return _client
 
 
+def discard_sandbox(sandbox_id: str) -> None:
+    """Forget a sandbox, e.g. after it has been deleted."""
+    _sandboxes.pop(sandbox_id, None)
+    _live_sandboxes.pop(sandbox_id, None)
+
+
 def clear() -> None:
     """Clear the sandbox cache."""
     _sandboxes.clear()
+    _live_sandboxes.clear()
 
 
 async def get_sandbox(sandbox_id: str) -> Any:
-    """Get or fetch a sandbox by ID with cache lock protection."""
-    if _client is None:
+    """Get a cached sandbox by ID, fetching and caching it on a miss."""
+    # Module globals are read once into locals for the rest of the call.
+    client = _client
+    if client is None:
         raise RuntimeError("BayClient not initialized")
-
-    lock = _get_lock()
-    async with lock:
-        if sandbox_id in _sandboxes:
-            _sandboxes.move_to_end(sandbox_id)
-            return _sandboxes[sandbox_id]
-
-    # Fetch from server (outside lock to avoid holding it during I/O)
-    async with asyncio.timeout(_config.SDK_CALL_TIMEOUT):
-        sandbox = await _client.get_sandbox(sandbox_id)
-
-    async with lock:
-        cache_sandbox(sandbox)
-    return sandbox
+    cache = _sandboxes
+
+    # The hit path never awaits, so it runs atomically on the event loop and
+    # does not need the cache lock.
+    # Entries past their TTL are dropped and re-fetched, so the server
+    # reports the expiry instead of a stale handle being reused.
+    cached = cache.pop(sandbox_id, _MISS)
+    if cached is not _MISS and not _is_expired(cached):
+        cache[sandbox_id] = cached
+        return cached
+
+    # Fetch from server under a per-id lock (the cache lock is not held
+    # during I/O). Callers that waited on the lock re-check the cache first.
+    fetch_locks = _fetch_locks
+    fetch_waiters = _fetch_waiters
+    fetch_lock = fetch_locks.get(sandbox_id)
+    if fetch_lock is None:
+        fetch_lock = fetch_locks[sandbox_id] = asyncio.Lock()
+    fetch_waiters[sandbox_id] = fetch_waiters.get(sandbox_id, 0) + 1
+    try:
+        async with fetch_lock:
+            cached = cache.pop(sandbox_id, _MISS)
+            if cached is not _MISS and not _is_expired(cached):
+                cache[sandbox_id] = cached
+                return cached
+
+            # Evicted from the LRU but still held by another tool call:
+            # promote it back instead of fetching it again.
+            sandbox = _live_sandboxes.get(sandbox_id)
+            if sandbox is not None and not _is_expired(sandbox):
+                async with _get_lock():
+                    cache_sandbox(sandbox)
+                return sandbox
+
+            sandbox = await call_with_timeout(
+                client.get_sandbox(sandbox_id),
+                _config.SDK_CALL_TIMEOUT,
+            )
+            async with _get_lock():
+                cache_sandbox(sandbox)
+            return sandbox
+    finally:
+        remaining = fetch_waiters[sandbox_id] - 1
+        if remaining:
+            fetch_waiters[sandbox_id] = remaining
+        else:
+            del fetch_waiters[sandbox_id]
+            del fetch_locks[sandbox_id]
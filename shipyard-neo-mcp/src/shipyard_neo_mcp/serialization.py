@@ -0,0 +1,83 @@
+"""JSON serialization helpers for tool responses."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import orjson
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Most list items dumps_capped encodes in one call, and the item types
+# that make it encode a slice item by item instead.
+_LIST_SLICE = 256
+_CONTAINER_TYPES = frozenset({dict, list})
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize ``obj`` to compact JSON text.
+
+    Uses ``orjson`` and falls back to the stdlib encoder for values orjson
+    rejects (e.g. integers wider than 64 bits). Non-JSON values are rendered
+    with ``str()`` in both paths.
+    """
+    try:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, ensure_ascii=False, default=str, separators=(",", ":"))
+
+
+def dumps_capped(obj: Any, *, limit: int) -> str:
+    """Serialize ``obj`` to JSON, stopping once the output exceeds ``limit``.
+
+    Object members and array items are encoded a few at a time at every
+    depth, so a large payload (including one wrapped in a single member,
+    such as ``{"commands": [...]}``) is only serialized up to about the
+    value that crosses the limit. Over-limit output is cut to ``limit`` chars and
+    marked as truncated; the full serialized length is not known at that
+    point.
+    """
+    parts: list[str] = []
+    total = 0
+    for chunk in _iter_json(obj):
+        parts.append(chunk)
+        total += len(chunk)
+        if total > limit:
+            return _capped("".join(parts), limit)
+    return "".join(parts)
+
+
+def _iter_json(obj: Any) -> Iterator[str]:
+    """Yield the compact JSON text of ``obj`` in pieces, one value at a time."""
+    if isinstance(obj, dict) and obj:
+        separator = "{"
+        for key, value in obj.items():
+            # Encode the key the way dumps_json would, then drop the ``0}``.
+            yield separator + dumps_json({key: 0})[1:-2]
+            separator = ","
+            yield from _iter_json(value)
+        yield "}"
+    elif isinstance(obj, list) and obj:
+        # Items go in slices: a slice without nested containers is encoded
+        # in one call, so a long flat list costs a few orjson calls rather
+        # than one per item. Slices with containers are descended into.
+        separator = "["
+        for start in range(0, len(obj), _LIST_SLICE):
+            items = obj[start : start + _LIST_SLICE]
+            if _CONTAINER_TYPES.isdisjoint(map(type, items)):
+                yield separator + dumps_json(items)[1:-1]
+                separator = ","
+                continue
+            for item in items:
+                yield separator
+                separator = ","
+                yield from _iter_json(item)
+        yield "]"
+    else:
+        yield dumps_json(obj)
+
+
+def _capped(text: str, limit: int) -> str:
+    return f"{text[:limit]}\n\n...[truncated; serialized output exceeds {limit} chars]"
@@ -7,21 +7,29 @@ allowing AI agents to create sandboxes and execute code securely.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import sys
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 
+from jsonschema.exceptions import best_match
 from mcp.server import Server
+from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
-from mcp.types import TextContent, Tool
+from mcp.types import CallToolResult, TextContent, Tool
 
-from shipyard_neo import BayError
+from shipyard_neo import BayClient
 
 from shipyard_neo_mcp import config as _config_mod
+from shipyard_neo_mcp import payload_cache as _payload_cache_mod
 from shipyard_neo_mcp import sandbox_cache as _cache_mod
-from shipyard_neo_mcp.config import get_config  # noqa: F401
+from shipyard_neo_mcp.config import get_config, reset_config  # noqa: F401
+from shipyard_neo_mcp.dispatch import (  # noqa: F401
+    _ERR_HANDLERS,
+    dispatch as _dispatch,
+    format_bay_error as _format_bay_error,
+)
 from shipyard_neo_mcp.validators import (  # noqa: F401
     validate_sandbox_id as _validate_sandbox_id,
     validate_relative_path as _validate_relative_path,
@@ -36,12 +44,16 @@ from shipyard_neo_mcp.validators import (  # noqa: F401
     read_release_stage as _read_release_stage,
     require_str_list as _require_str_list,
 )
-from shipyard_neo_mcp.tool_defs import get_tool_definitions
+from shipyard_neo_mcp.tool_defs import get_input_validator, get_tool_definitions
 from shipyard_neo_mcp.handlers import TOOL_HANDLERS
+from shipyard_neo_mcp.handlers import sandbox as _sandbox_handlers
 
 
 logger = logging.getLogger("shipyard_neo_mcp")
 
+# The registry is built once at import, so its lookup can be bound too.
+_get_handler = TOOL_HANDLERS.get
+
 # ── Backward-compatibility layer ──
 # Tests do things like:
 #   mcp_server._client = FakeClient()
@@ -72,20 +84,23 @@ _original_class = type(_module)
 class _BackcompatModule(_original_class):
     """Module subclass that proxies attribute access to sub-modules."""
 
+    # Every proxied name is underscore-prefixed, so public names skip the
+    # map lookup entirely.
+
     def __getattr__(self, name: str) -> Any:
-        entry = _PROXY_MAP.get(name)
-        if entry is not None:
-            mod, attr = entry
-            return getattr(mod, attr)
+        if name[:1] == "_":
+            entry = _PROXY_MAP.get(name)
+            if entry is not None:
+                mod, attr = entry
+                return getattr(mod, attr)
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
     def __setattr__(self, name: str, value: Any) -> None:
-        entry = _PROXY_MAP.get(name)
-        if entry is not None:
-            mod, attr = entry
-            setattr(mod, attr, value)
+        if name[:1] != "_" or name not in _PROXY_MAP:
+            super().__setattr__(name, value)
             return
-        super().__setattr__(name, value)
+        mod, attr = _PROXY_MAP[name]
+        setattr(mod, attr, value)
 
 
 _module.__class__ = _BackcompatModule
@@ -105,19 +120,9 @@ def _get_lock() -> asyncio.Lock:
 get_sandbox = _cache_mod.get_sandbox
 
 
-def _format_bay_error(error: BayError) -> str:
-    suffix = ""
-    if error.details:
-        serialized = json.dumps(error.details, ensure_ascii=False, default=str)
-        suffix = f"\n\ndetails: {_truncate_text(serialized, limit=1000)}"
-    return f"**API Error:** [{error.code}] {error.message}{suffix}"
-
-
 @asynccontextmanager
 async def lifespan(server: Server):
     """Manage the BayClient lifecycle."""
-    from shipyard_neo import BayClient
-
     config = get_config()
     client = BayClient(
         endpoint_url=config["endpoint_url"],
@@ -125,13 +130,22 @@ async def lifespan(server: Server):
     )
     await client.__aenter__()
     _cache_mod._client = client
+    if _config_mod.PREWARM_SANDBOX:
+        _sandbox_handlers.start_prewarm(client)
 
     try:
         yield
     finally:
-        await client.__aexit__(None, None, None)
+        # An unused prewarmed sandbox must be released while the client
+        # is still open.
+        await _sandbox_handlers.aclose_prewarm()
+        # Closing the client and cancelling payload fetches are independent.
+        await asyncio.gather(
+            client.__aexit__(None, None, None),
+            _payload_cache_mod.aclose(),
+        )
         _cache_mod._client = None
-        _cache_mod._sandboxes.clear()
+        _cache_mod.clear()
 
 
 # Create MCP server
@@ -144,36 +158,47 @@ async def list_tools() -> list[Tool]:
     return get_tool_definitions()
 
 
-@server.call_tool()
+@server.call_tool(validate_input=False)
+async def _call_tool_checked(
+    name: str, arguments: dict[str, Any]
+) -> list[TextContent] | CallToolResult:
+    """Validate arguments against the tool's precompiled schema, then dispatch.
+
+    Mirrors the MCP server's built-in input validation (same error text) but
+    reuses one validator per tool instead of rebuilding it per call.
+    """
+    # Names arrive as fresh strings; interning lets the registry lookups
+    # below match the literal keys by identity.
+    name = sys.intern(name)
+    validator = get_input_validator(name)
+    if validator is not None and not validator.is_valid(arguments):
+        error = best_match(validator.iter_errors(arguments))
+        return CallToolResult(
+            content=[
+                TextContent(
+                    type="text", text=f"Input validation error: {error.message}"
+                )
+            ],
+            isError=True,
+        )
+    return await call_tool(name, arguments)
+
+
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls by dispatching to the appropriate handler."""
     if _cache_mod._client is None:
         return [TextContent(type="text", text="Error: BayClient not initialized")]
 
-    try:
-        handler = TOOL_HANDLERS.get(name)
-        if handler is None:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
-        return await handler(arguments)
-
-    except ValueError as e:
-        return [TextContent(type="text", text=f"**Validation Error:** {e!s}")]
-    except TimeoutError:
-        logger.warning(
-            "tool_timeout tool=%s timeout=%ds", name, _config_mod.SDK_CALL_TIMEOUT
-        )
-        return [
-            TextContent(
-                type="text",
-                text=f"**Timeout Error:** SDK call timed out after {_config_mod.SDK_CALL_TIMEOUT}s",
-            )
-        ]
-    except BayError as e:
-        logger.warning("bay_error tool=%s code=%s message=%s", name, e.code, e.message)
-        return [TextContent(type="text", text=_format_bay_error(e))]
-    except Exception as e:
-        logger.exception("unexpected_error tool=%s", name)
-        return [TextContent(type="text", text=f"**Error:** {e!s}")]
+    handler = _get_handler(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await _dispatch(handler, name, arguments)
+
+
+@lru_cache(maxsize=1)
+def _initialization_options() -> InitializationOptions:
+    """Build the server's initialization options once; they never change."""
+    return server.create_initialization_options()
 
 
 async def run_server():
@@ -183,7 +208,7 @@ async def run_server():
             await server.run(
                 read_stream,
                 write_stream,
-                server.create_initialization_options(),
+                _initialization_options(),
             )
 
 
@@ -0,0 +1,38 @@
+"""Timeout helper for SDK calls made by tool handlers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def call_with_timeout(aw: Awaitable[T], timeout: float) -> T:
+    """Await ``aw``, cancelling it if it does not finish within ``timeout`` seconds.
+
+    Schedules a single ``loop.call_at`` handle on the awaited future instead of
+    entering an ``asyncio.timeout()`` context per call. A cancellation caused by
+    the deadline is surfaced as ``TimeoutError``; cancellation coming from the
+    caller propagates unchanged.
+    """
+    loop = asyncio.get_running_loop()
+    fut = asyncio.ensure_future(aw)
+    timed_out = False
+
+    def _on_timeout() -> None:
+        nonlocal timed_out
+        if not fut.done():
+            timed_out = True
+            fut.cancel()
+
+    handle = loop.call_at(loop.time() + timeout, _on_timeout)
+    try:
+        return await fut
+    except asyncio.CancelledError:
+        if timed_out:
+            raise TimeoutError from None
+        raise
+    finally:
+        handle.cancel()
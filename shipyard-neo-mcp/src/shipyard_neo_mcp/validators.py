@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 
-# Sandbox ID format: alphanumeric + hyphens + underscores, 1-128 chars
-_SANDBOX_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{1,128}$")
+# Sandbox ID format: alphanumeric + hyphens + underscores, 1-128 chars.
+# fullmatch, unlike match with ``$``, also rejects a trailing newline.
+_SANDBOX_ID_RE = re.compile(r"[a-zA-Z0-9_-]{1,128}")
+_sandbox_id_match = _SANDBOX_ID_RE.fullmatch
+_SANDBOX_ID_ERROR = (
+    "invalid sandbox_id format: must be 1-128 alphanumeric/hyphen/underscore characters"
+)
 
 
 def validate_relative_path(path: str) -> str:
@@ -22,25 +30,51 @@ def validate_relative_path(path: str) -> str:
         raise ValueError("field 'path' must be a non-empty string")
     if path.startswith("/"):
         raise ValueError("invalid path: absolute paths are not allowed")
-    # Normalize separators a bit (still let Bay do strict validation)
-    parts = [p for p in path.split("/") if p not in ("", ".")]
-    if any(p == ".." for p in parts):
-        raise ValueError("invalid path: path traversal ('..') is not allowed")
+    # Most paths contain no ".." at all; only split when one might be a
+    # real segment rather than part of a file name (still let Bay do
+    # strict validation).
+    if ".." in path:
+        for part in path.split("/"):
+            if part == "..":
+                raise ValueError("invalid path: path traversal ('..') is not allowed")
     return path
 
 
-def validate_local_path(local_path: str) -> Path:
+def validate_local_path(local_path: str, *, resolve: bool = True) -> Path:
     """Validate and resolve a local filesystem path.
 
     Ensures the path is absolute (or resolves relative to cwd),
-    and does not contain null bytes.
+    and does not contain null bytes. With ``resolve=False`` the path is
+    only made absolute and normalized lexically, skipping the filesystem
+    lookups needed to follow symlinks.
     """
     if not isinstance(local_path, str) or not local_path.strip():
         raise ValueError("field 'local_path' must be a non-empty string")
     if "\x00" in local_path:
         raise ValueError("invalid local_path: null bytes not allowed")
-    resolved = Path(local_path).expanduser().resolve()
-    return resolved
+    if local_path.startswith("~"):
+        local_path = os.path.expanduser(local_path)
+    if resolve:
+        return Path(local_path).resolve()
+    return Path(os.path.abspath(local_path))
+
+
+def truncate_parts(text: str | None, *, limit: int) -> tuple[str, ...]:
+    """Split text into the pieces of its truncated form, without joining them.
+
+    Callers that assemble a larger response can splice these pieces into
+    their own join, so a long text is copied once (the slice) rather than
+    again into an intermediate truncated string.
+    """
+    if text is None:
+        return ("",)
+    size = len(text)
+    if size <= limit:
+        return (text,)
+    return (
+        text[:limit],
+        f"\n\n...[truncated {size - limit} chars; original={size}]",
+    )
 
 
 def truncate_text(text: str | None, *, limit: int) -> str:
@@ -49,9 +83,7 @@ def truncate_text(text: str | None, *, limit: int) -> str:
         return ""
     if len(text) <= limit:
         return text
-    trimmed = text[:limit]
-    hidden = len(text) - limit
-    return f"{trimmed}\n\n...[truncated {hidden} chars; original={len(text)}]"
+    return "".join(truncate_parts(text, limit=limit))
 
 
 def require_str(arguments: dict[str, Any], key: str) -> str:
@@ -62,13 +94,11 @@ def require_str(arguments: dict[str, Any], key: str) -> str:
     return value
 
 
-def validate_sandbox_id(arguments: dict[str, Any]) -> str:
+def validate_sandbox_id(arguments: dict[str, Any], key: str = "sandbox_id") -> str:
     """Extract and validate sandbox_id format to prevent injection."""
-    sandbox_id = require_str(arguments, "sandbox_id")
-    if not _SANDBOX_ID_RE.match(sandbox_id):
-        raise ValueError(
-            "invalid sandbox_id format: must be 1-128 alphanumeric/hyphen/underscore characters"
-        )
+    sandbox_id = require_str(arguments, key)
+    if not _sandbox_id_match(sandbox_id):
+        raise ValueError(_SANDBOX_ID_ERROR)
     return sandbox_id
 
 
@@ -119,6 +149,13 @@ def read_optional_number(arguments: dict[str, Any], key: str) -> float | None:
     return float(value)
 
 
+_EXEC_TYPES = frozenset({"python", "shell", "browser", "browser_batch"})
+
+
+def _exec_type_error(key: str) -> str:
+    return f"field '{key}' must be one of: python, shell, browser, browser_batch"
+
+
 def read_exec_type(arguments: dict[str, Any], key: str = "exec_type") -> str | None:
     """Extract and validate an optional execution type filter."""
     value = arguments.get(key)
@@ -126,10 +163,8 @@ def read_exec_type(arguments: dict[str, Any], key: str = "exec_type") -> str | N
         return None
     if not isinstance(value, str):
         raise ValueError(f"field '{key}' must be a string")
-    if value not in {"python", "shell", "browser", "browser_batch"}:
-        raise ValueError(
-            f"field '{key}' must be one of: python, shell, browser, browser_batch"
-        )
+    if value not in _EXEC_TYPES:
+        raise ValueError(_exec_type_error(key))
     return value
 
 
@@ -165,3 +200,63 @@ def require_str_list(arguments: dict[str, Any], key: str) -> list[str]:
             raise ValueError(f"field '{key}' must be a non-empty array of strings")
         normalized.append(item)
     return normalized
+
+
+def build_validator(
+    *fields: tuple[Any, ...],
+) -> Callable[[dict[str, Any]], tuple[Any, ...]]:
+    """Build a single-pass argument validator for one tool.
+
+    Each field is ``(kind, key, *params)`` where ``kind`` is one of:
+
+    - ``"sandbox_id"``: read with :func:`validate_sandbox_id`
+    - ``"str"``: read with :func:`require_str`
+    - ``"optional_str"``: read with :func:`optional_str`
+    - ``"bool"``, ``default``: read with :func:`read_bool`
+    - ``"int"``, ``default``, ``min_value``, ``max_value``: read with
+      :func:`read_int`
+    - ``"exec_type"``: read with :func:`read_exec_type`
+    - ``"str_list"``: read with :func:`require_str_list`
+
+    Fields are read in order by those helpers, so errors match theirs, and
+    the validated values are returned as a tuple. The readers are bound once,
+    at import time of the caller.
+    """
+    readers: list[Callable[[dict[str, Any]], Any]] = []
+    for kind, key, *params in fields:
+        reader = _FIELD_READERS.get(kind)
+        if reader is None:
+            raise ValueError(f"unknown field kind: {kind!r}")
+        if kind == "int":
+            default, min_value, max_value = params
+            readers.append(
+                partial(
+                    read_int,
+                    key=key,
+                    default=default,
+                    min_value=min_value,
+                    max_value=max_value,
+                )
+            )
+        elif kind == "bool":
+            (default,) = params
+            readers.append(partial(read_bool, key=key, default=default))
+        else:
+            readers.append(partial(reader, key=key))
+
+    def validate(arguments: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple([read(arguments) for read in readers])
+
+    return validate
+
+
+# Field kind -> reader used by build_validator.
+_FIELD_READERS: dict[str, Callable[..., Any]] = {
+    "sandbox_id": validate_sandbox_id,
+    "str": require_str,
+    "optional_str": optional_str,
+    "bool": read_bool,
+    "int": read_int,
+    "exec_type": read_exec_type,
+    "str_list": require_str_list,
+}
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
+import asyncio
+import gc
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
+from shipyard_neo_mcp import dispatch as dispatch_mod
+from shipyard_neo_mcp import payload_cache
 from shipyard_neo_mcp import server as mcp_server
+from shipyard_neo_mcp.handlers import sandbox as sandbox_handlers
 
 from shipyard_neo import BayError
 from shipyard_neo.types import SkillCandidateStatus, SkillReleaseStage
@@ -187,6 +194,10 @@ class FakeSandbox:
                     execution_time_ms=6,
                     description="desc",
                     tags="tag1,tag2",
+                    notes=None,
+                    code="print('x')",
+                    output="x\n",
+                    error=None,
                 )
             ],
         )
@@ -415,7 +426,14 @@ class FakeClient:
 def reset_globals(monkeypatch):
     """Isolate global state between tests."""
     monkeypatch.setattr(mcp_server, "_client", None)
-    monkeypatch.setattr(mcp_server, "_sandboxes", OrderedDict())
+    monkeypatch.setattr(mcp_server, "_sandboxes", {})
+    monkeypatch.setattr(sandbox_handlers, "_prewarm", None)
+    monkeypatch.setattr(dispatch_mod, "_last_logged", {})
+    mcp_server._cache_mod._live_sandboxes.clear()
+    payload_cache.clear()
+    mcp_server.reset_config()
+    yield
+    mcp_server.reset_config()
 
 
 @pytest.mark.asyncio
@@ -437,6 +455,222 @@ async def test_list_tools_contains_history_and_skill_tools():
     assert "list_profiles" in names
 
 
+@pytest.mark.asyncio
+async def test_list_tools_reuses_built_definitions():
+    assert await mcp_server.list_tools() is await mcp_server.list_tools()
+
+
+@pytest.mark.asyncio
+async def test_every_listed_tool_has_a_dispatch_handler():
+    from shipyard_neo_mcp.handlers import TOOL_HANDLERS
+
+    names = [tool.name for tool in await mcp_server.list_tools()]
+
+    assert len(names) == len(set(names))
+    assert set(names) == set(TOOL_HANDLERS)
+
+
+def test_initialization_options_are_built_once():
+    first = mcp_server._initialization_options()
+
+    assert mcp_server._initialization_options() is first
+    assert first.server_name == "shipyard-neo-mcp"
+    assert first.capabilities.tools is not None
+
+
+@pytest.mark.asyncio
+async def test_registered_call_tool_validates_input_schema():
+    import mcp.types as mcp_types
+
+    mcp_server._client = FakeClient()
+    handler = mcp_server.server.request_handlers[mcp_types.CallToolRequest]
+
+    def request(name, arguments):
+        return mcp_types.CallToolRequest(
+            params=mcp_types.CallToolRequestParams(name=name, arguments=arguments)
+        )
+
+    invalid = await handler(request("execute_python", {"sandbox_id": "sbx-1"}))
+    assert invalid.root.isError is True
+    assert invalid.root.content[0].text == (
+        "Input validation error: 'code' is a required property"
+    )
+
+    valid = await handler(request("list_profiles", {}))
+    assert valid.root.isError is False
+    assert "python-default" in valid.root.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_execute_python_renders_placeholders_for_empty_output():
+    sandbox = FakeSandbox()
+    results = iter(
+        [
+            SimpleNamespace(
+                success=True,
+                output="",
+                error=None,
+                execution_id=None,
+                execution_time_ms=None,
+                code=None,
+            ),
+            SimpleNamespace(
+                success=False, output="", error=None, execution_id=None, code=None
+            ),
+        ]
+    )
+
+    async def exec_(code, **_kwargs):
+        return next(results)
+
+    sandbox.python.exec = exec_
+    mcp_server._sandboxes["sbx-1"] = sandbox
+    mcp_server._client = FakeClient()
+
+    ok = await mcp_server.call_tool(
+        "execute_python", {"sandbox_id": "sbx-1", "code": "pass"}
+    )
+    failed = await mcp_server.call_tool(
+        "execute_python", {"sandbox_id": "sbx-1", "code": "pass"}
+    )
+
+    assert ok[0].text == "**Execution successful**\n\n```\n(no output)\n```"
+    assert failed[0].text == "**Execution failed**\n\n```\nUnknown error\n```"
+
+
+@pytest.mark.asyncio
+async def test_list_files_formats_entries():
+    sandbox = FakeSandbox()
+
+    async def list_dir(_path: str):
+        return [
+            SimpleNamespace(name="src", is_dir=True, size=None),
+            SimpleNamespace(name="a.txt", is_dir=False, size=12),
+            SimpleNamespace(name="b.bin", is_dir=False, size=None),
+        ]
+
+    sandbox.filesystem.list_dir = list_dir
+    mcp_server._sandboxes["sbx-1"] = sandbox
+    mcp_server._client = FakeClient()
+
+    response = await mcp_server.call_tool("list_files", {"sandbox_id": "sbx-1"})
+
+    assert response[0].text == (
+        "**Directory: .**\n\n📁 src/\n📄 a.txt (12 bytes)\n📄 b.bin"
+    )
+
+    response = await mcp_server.call_tool(
+        "list_files", {"sandbox_id": "sbx-1", "as_json": True}
+    )
+    assert json.loads(response[0].text) == {
+        "path": ".",
+        "entries": [
+            {"name": "src", "is_dir": True, "size": None},
+            {"name": "a.txt", "is_dir": False, "size": 12},
+            {"name": "b.bin", "is_dir": False, "size": None},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_calls_concurrently_and_isolates_errors():
+    fake_sandbox = FakeSandbox()
+    mcp_server._sandboxes["sbx-1"] = fake_sandbox
+    mcp_server._client = FakeClient()
+
+    response = await mcp_server.call_tool(
+        "batch",
+        {
+            "calls": [
+                {
+                    "name": "read_file",
+                    "arguments": {"sandbox_id": "sbx-1", "path": "a"},
+                },
+                {"name": "read_file", "arguments": {"sandbox_id": "sbx-1"}},
+                {"name": "no_such_tool"},
+                {"name": "list_profiles"},
+            ]
+        },
+    )
+
+    assert [item.text.split("\n", 1)[0] for item in response] == [
+        "**[0] read_file**",
+        "**[1] read_file**",
+        "**[2] no_such_tool**",
+        "**[3] list_profiles**",
+    ]
+    assert "content" in response[0].text
+    assert "Input validation error: 'path' is a required property" in response[1].text
+    assert "Unknown tool: no_such_tool" in response[2].text
+    assert "python-default" in response[3].text
+
+
+@pytest.mark.asyncio
+async def test_batch_stop_on_error_skips_remaining_sequential_calls():
+    mcp_server._sandboxes["sbx-1"] = FakeSandbox()
+    mcp_server._client = FakeClient()
+
+    response = await mcp_server.call_tool(
+        "batch",
+        {
+            "calls": [
+                {"name": "list_profiles"},
+                {
+                    "name": "read_file",
+                    "arguments": {"sandbox_id": "bad id", "path": "a"},
+                },
+                {"name": "list_profiles"},
+            ],
+            "max_concurrent": 1,
+            "stop_on_error": True,
+        },
+    )
+
+    assert "python-default" in response[0].text
+    assert "**Validation Error:**" in response[1].text
+    assert response[2].text == (
+        "**[2] list_profiles**\n\nSkipped: an earlier call in this batch failed."
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_max_concurrent_bounds_running_calls():
+    running = 0
+    peak = 0
+
+    class SlowFilesystem(FakeFilesystem):
+        async def read_file(self, path: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return path
+
+    sandbox = FakeSandbox()
+    sandbox.filesystem = SlowFilesystem()
+    mcp_server._sandboxes["sbx-1"] = sandbox
+    mcp_server._client = FakeClient()
+
+    call = {"name": "read_file", "arguments": {"sandbox_id": "sbx-1", "path": "a"}}
+    await mcp_server.call_tool("batch", {"calls": [call] * 6, "max_concurrent": 2})
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_nested_batch():
+    mcp_server._client = FakeClient()
+
+    response = await mcp_server.call_tool(
+        "batch", {"calls": [{"name": "batch", "arguments": {"calls": []}}]}
+    )
+
+    assert response[0].text == (
+        "**Validation Error:** calls[0]: batch calls cannot be nested"
+    )
+
+
 @pytest.mark.asyncio
 async def test_call_tool_requires_initialized_client():
     response = await mcp_server.call_tool("unknown", {})
@@ -495,6 +729,23 @@ async def test_get_execution_history_formats_entries():
     assert "tags: tag1,tag2" in text
 
 
+@pytest.mark.asyncio
+async def test_get_execution_history_include_detail_renders_records():
+    fake_sandbox = FakeSandbox()
+    mcp_server._sandboxes["sbx-1"] = fake_sandbox
+    mcp_server._client = FakeClient()
+
+    plain = await mcp_server.call_tool("get_execution_history", {"sandbox_id": "sbx-1"})
+    detailed = await mcp_server.call_tool(
+        "get_execution_history", {"sandbox_id": "sbx-1", "include_detail": True}
+    )
+
+    assert "print('x')" not in plain[0].text
+    assert "  code:\nprint('x')" in detailed[0].text
+    assert "  output:\nx\n" in detailed[0].text
+    assert "error:" not in detailed[0].text
+
+
 @pytest.mark.asyncio
 async def test_get_execution_history_empty_message():
     class EmptyHistorySandbox(FakeSandbox):
@@ -539,6 +790,59 @@ async def test_create_skill_payload_tool_calls_sdk_manager():
     assert "kind: candidate_payload" in text
 
 
+@pytest.mark.asyncio
+async def test_create_skill_payloads_tool_creates_each_item():
+    skills = FakeSkills()
+    mcp_server._client = FakeClient(skills=skills)
+
+    response = await mcp_server.call_tool(
+        "create_skill_payloads",
+        {
+            "items": [
+                {"payload": {"commands": ["open about:blank"]}},
+                {"payload": ["step"], "kind": "candidate_payload"},
+            ]
+        },
+    )
+    lines = response[0].text.splitlines()
+    assert lines[0].startswith("Created 2 skill payloads")
+    assert lines[1:] == ["blob:blob-1\tgeneric", "blob:blob-1\tcandidate_payload"]
+
+
+@pytest.mark.asyncio
+async def test_create_skill_payloads_reports_refs_when_some_items_fail():
+    from shipyard_neo.errors import ValidationError
+
+    class FlakySkills(FakeSkills):
+        async def create_payload(self, *, payload, kind="generic"):
+            if kind == "bad":
+                raise ValidationError("payload rejected")
+            return await super().create_payload(payload=payload, kind=kind)
+
+    mcp_server._client = FakeClient(skills=FlakySkills())
+
+    response = await mcp_server.call_tool(
+        "create_skill_payloads",
+        {"items": [{"payload": {"a": 1}}, {"payload": [1], "kind": "bad"}]},
+    )
+    lines = response[0].text.splitlines()
+    assert lines[0].startswith("Created 1 skill payloads, 1 failed")
+    assert lines[1] == "blob:blob-1\tgeneric"
+    assert lines[2].startswith("items[1]\t**API Error:** [validation_error]")
+
+
+@pytest.mark.asyncio
+async def test_create_skill_payloads_rejects_invalid_item():
+    mcp_server._client = FakeClient()
+
+    response = await mcp_server.call_tool(
+        "create_skill_payloads",
+        {"items": [{"payload": {"a": 1}}, {"payload": "not-json"}]},
+    )
+    assert "**Validation Error:**" in response[0].text
+    assert "items[1].payload" in response[0].text
+
+
 @pytest.mark.asyncio
 async def test_get_skill_payload_tool_formats_payload():
     skills = FakeSkills()
@@ -551,7 +855,99 @@ async def test_get_skill_payload_tool_formats_payload():
     text = response[0].text
     assert "payload_ref: blob:blob-1" in text
     assert "kind: candidate_payload" in text
-    assert '"commands": ["open about:blank"]' in text
+    assert '"commands":["open about:blank"]' in text
+
+
+def test_dumps_json_handles_non_str_keys_and_wide_ints():
+    from shipyard_neo_mcp.serialization import dumps_json
+
+    assert dumps_json({1: "a", "b": "ü"}) == '{"1":"a","b":"ü"}'
+    assert dumps_json({"n": 2**70}) == '{"n":1180591620717411303424}'
+
+
+def test_dumps_capped_stops_at_limit():
+    from shipyard_neo_mcp.serialization import dumps_capped
+
+    assert dumps_capped({"a": [1, 2]}, limit=100) == '{"a":[1,2]}'
+
+    capped = dumps_capped([str(i % 10) * 20 for i in range(1000)], limit=50)
+    head, marker = capped.split("\n\n", 1)
+    assert head == ('["' + "0" * 20 + '","' + "1" * 20 + '","' + "2" * 20)[:50]
+    assert marker == "...[truncated; serialized output exceeds 50 chars]"
+
+
+def test_dumps_capped_stops_early_inside_a_single_large_member():
+    from shipyard_neo_mcp.serialization import _LIST_SLICE, dumps_capped, dumps_json
+
+    encoded: list[int] = []
+
+    class Command:
+        def __init__(self, index: int) -> None:
+            self.index = index
+
+        def __str__(self) -> str:
+            encoded.append(self.index)
+            return f"click @e{self.index}"
+
+    payload = {"commands": [Command(i) for i in range(10_000)]}
+    capped = dumps_capped(payload, limit=100)
+
+    head, marker = capped.split("\n\n", 1)
+    assert head == dumps_json({"commands": [f"click @e{i}" for i in range(20)]})[:100]
+    assert marker == "...[truncated; serialized output exceeds 100 chars]"
+    assert len(encoded) <= _LIST_SLICE
+    assert (
+        dumps_capped({"a": {"b": [1, {}], 2: []}}, limit=100)
+        == '{"a":{"b":[1,{}],"2":[]}}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_skill_payload_reuses_cached_and_inflight_fetches():
+    skills = FakeSkills()
+    calls: list[str] = []
+    original = skills.get_payload
+
+    async def counting_get_payload(payload_ref: str):
+        calls.append(payload_ref)
+        await asyncio.sleep(0)
+        return await original(payload_ref)
+
+    skills.get_payload = counting_get_payload
+    mcp_server._client = FakeClient(skills=skills)
+
+    first, second = await asyncio.gather(
+        mcp_server.call_tool("get_skill_payload", {"payload_ref": "blob:blob-1"}),
+        mcp_server.call_tool("get_skill_payload", {"payload_ref": "blob:blob-1"}),
+    )
+    third = await mcp_server.call_tool(
+        "get_skill_payload", {"payload_ref": "blob:blob-1"}
+    )
+
+    assert calls == ["blob:blob-1"]
+    assert first[0].text == second[0].text == third[0].text
+
+
+@pytest.mark.asyncio
+async def test_get_skill_payload_cache_expires(monkeypatch):
+    skills = FakeSkills()
+    calls: list[str] = []
+    original = skills.get_payload
+
+    async def counting_get_payload(payload_ref: str):
+        calls.append(payload_ref)
+        return await original(payload_ref)
+
+    skills.get_payload = counting_get_payload
+    mcp_server._client = FakeClient(skills=skills)
+    clock = [1000.0]
+    monkeypatch.setattr(payload_cache, "_clock", lambda: clock[0])
+
+    await mcp_server.call_tool("get_skill_payload", {"payload_ref": "blob:blob-1"})
+    clock[0] += 61
+    await mcp_server.call_tool("get_skill_payload", {"payload_ref": "blob:blob-1"})
+
+    assert calls == ["blob:blob-1", "blob:blob-1"]
 
 
 @pytest.mark.asyncio
@@ -570,6 +966,89 @@ async def test_promote_skill_candidate_defaults_to_canary():
     assert skills.last_promote_stage == "canary"
 
 
+@pytest.mark.asyncio
+async def test_list_skill_candidates_and_releases_empty():
+    mcp_server._client = FakeClient()
+
+    first = await mcp_server.call_tool("list_skill_candidates", {})
+    second = await mcp_server.call_tool("list_skill_candidates", {})
+    assert first[0].text == "No skill candidates found."
+    assert first is not second
+    response = await mcp_server.call_tool("list_skill_releases", {})
+    assert response[0].text == "No skill releases found."
+
+
+@pytest.mark.asyncio
+async def test_list_skill_candidates_and_releases_format_rows():
+    skills = FakeSkills()
+
+    async def list_candidates(**_):
+        return SimpleNamespace(
+            total=1,
+            items=[
+                SimpleNamespace(
+                    id="sc-1",
+                    skill_key="csv-loader",
+                    status=SkillCandidateStatus.DRAFT,
+                    latest_pass=None,
+                )
+            ],
+        )
+
+    async def list_releases(**_):
+        return SimpleNamespace(
+            total=1,
+            items=[
+                SimpleNamespace(
+                    id="sr-1",
+                    skill_key="csv-loader",
+                    version=3,
+                    stage=SkillReleaseStage.STABLE,
+                    is_active=True,
+                )
+            ],
+        )
+
+    skills.list_candidates = list_candidates
+    skills.list_releases = list_releases
+    mcp_server._client = FakeClient(skills=skills)
+
+    response = await mcp_server.call_tool("list_skill_candidates", {})
+    assert response[0].text == (
+        "Total: 1\n- sc-1 | csv-loader | status=draft | pass=None"
+    )
+    response = await mcp_server.call_tool("list_skill_releases", {})
+    assert response[0].text == (
+        "Total: 1\n- sr-1 | csv-loader v3 | stage=stable | active=True"
+    )
+
+    response = await mcp_server.call_tool("list_skill_candidates", {"as_json": True})
+    assert json.loads(response[0].text) == {
+        "total": 1,
+        "items": [
+            {
+                "id": "sc-1",
+                "skill_key": "csv-loader",
+                "status": "draft",
+                "latest_pass": None,
+            }
+        ],
+    }
+    response = await mcp_server.call_tool("list_skill_releases", {"as_json": True})
+    assert json.loads(response[0].text) == {
+        "total": 1,
+        "items": [
+            {
+                "id": "sr-1",
+                "skill_key": "csv-loader",
+                "version": 3,
+                "stage": "stable",
+                "is_active": True,
+            }
+        ],
+    }
+
+
 @pytest.mark.asyncio
 async def test_promote_skill_candidate_forwards_upgrade_fields():
     skills = FakeSkills()
@@ -644,6 +1123,224 @@ async def test_call_tool_surfaces_bay_errors():
     assert "[internal_error] upstream failure" in response[0].text
 
 
+@pytest.mark.asyncio
+async def test_lifespan_closes_client_and_cancels_payload_fetches(monkeypatch):
+    closed: list[bool] = []
+    started = asyncio.Event()
+
+    class HangingSkills(FakeSkills):
+        async def get_payload(self, payload_ref: str):
+            started.set()
+            await asyncio.sleep(3600)
+
+    class LifespanClient(FakeClient):
+        def __init__(self, **_kwargs) -> None:
+            super().__init__(skills=HangingSkills())
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc) -> None:
+            closed.append(True)
+
+    monkeypatch.setenv("SHIPYARD_ENDPOINT_URL", "http://localhost:8000")
+    monkeypatch.setenv("SHIPYARD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setattr(mcp_server, "BayClient", LifespanClient)
+
+    async with mcp_server.lifespan(mcp_server.server):
+        task = asyncio.ensure_future(payload_cache.get_payload("blob:blob-1"))
+        await started.wait()
+
+    assert closed == [True]
+    assert mcp_server._client is None
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def _prewarm_client_class(deleted: list[str]):
+    class PrewarmClient(FakeClient):
+        def __init__(self, **_kwargs) -> None:
+            super().__init__()
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc) -> None:
+            return None
+
+        async def create_sandbox(self, profile: str, ttl: int):
+            sandbox = await super().create_sandbox(profile=profile, ttl=ttl)
+
+            async def delete() -> None:
+                deleted.append(sandbox.id)
+
+            sandbox.delete = delete
+            return sandbox
+
+    return PrewarmClient
+
+
+@pytest.mark.asyncio
+async def test_lifespan_prewarm_serves_first_default_create(monkeypatch):
+    deleted: list[str] = []
+    monkeypatch.setenv("SHIPYARD_ENDPOINT_URL", "http://localhost:8000")
+    monkeypatch.setenv("SHIPYARD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setattr(mcp_server._config_mod, "PREWARM_SANDBOX", True)
+    monkeypatch.setattr(mcp_server, "BayClient", _prewarm_client_class(deleted))
+
+    async with mcp_server.lifespan(mcp_server.server):
+        client = mcp_server._client
+        await asyncio.sleep(0)
+        assert client.created_sandbox_ids == ["sbx-new"]
+
+        response = await mcp_server.call_tool("create_sandbox", {})
+        assert "`sbx-new`" in response[0].text
+        assert client.created_sandbox_ids == ["sbx-new"]
+
+        await mcp_server.call_tool("create_sandbox", {})
+        assert client.created_sandbox_ids == ["sbx-new", "sbx-new"]
+
+    assert deleted == []
+
+
+@pytest.mark.asyncio
+async def test_lifespan_deletes_unused_prewarmed_sandbox(monkeypatch):
+    deleted: list[str] = []
+    monkeypatch.setenv("SHIPYARD_ENDPOINT_URL", "http://localhost:8000")
+    monkeypatch.setenv("SHIPYARD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setattr(mcp_server._config_mod, "PREWARM_SANDBOX", True)
+    monkeypatch.setattr(mcp_server, "BayClient", _prewarm_client_class(deleted))
+
+    async with mcp_server.lifespan(mcp_server.server):
+        await asyncio.sleep(0)
+
+    assert deleted == ["sbx-new"]
+    assert sandbox_handlers._prewarm is None
+
+
+@pytest.mark.asyncio
+async def test_stale_prewarmed_sandbox_is_deleted_and_replaced(monkeypatch):
+    deleted: list[str] = []
+    monkeypatch.setenv("SHIPYARD_ENDPOINT_URL", "http://localhost:8000")
+    monkeypatch.setenv("SHIPYARD_ACCESS_TOKEN", "test-token")
+    client = _prewarm_client_class(deleted)()
+    create_sandbox = client.create_sandbox
+    expires = [datetime.now(timezone.utc) + timedelta(seconds=60), None]
+
+    async def create_with_expiry(profile: str, ttl: int):
+        sandbox = await create_sandbox(profile=profile, ttl=ttl)
+        sandbox.expires_at = expires.pop(0)
+        return sandbox
+
+    client.create_sandbox = create_with_expiry
+    mcp_server._client = client
+    sandbox_handlers.start_prewarm(client)
+
+    response = await mcp_server.call_tool("create_sandbox", {})
+
+    assert client.created_sandbox_ids == ["sbx-new", "sbx-new"]
+    assert "**TTL:** 3600 seconds" in response[0].text
+    await sandbox_handlers.aclose_prewarm()
+    assert deleted == ["sbx-new"]
+
+
+@pytest.mark.asyncio
+async def test_slow_prewarm_times_out_once_and_is_deleted_later(monkeypatch):
+    deleted: list[str] = []
+    monkeypatch.setenv("SHIPYARD_ENDPOINT_URL", "http://localhost:8000")
+    monkeypatch.setenv("SHIPYARD_ACCESS_TOKEN", "test-token")
+    client = _prewarm_client_class(deleted)()
+    create_sandbox = client.create_sandbox
+    release = asyncio.Event()
+    calls: list[int] = []
+
+    async def slow_create(profile: str, ttl: int):
+        calls.append(ttl)
+        await release.wait()
+        return await create_sandbox(profile=profile, ttl=ttl)
+
+    client.create_sandbox = slow_create
+    monkeypatch.setattr(mcp_server, "_SDK_CALL_TIMEOUT", 0.01)
+    mcp_server._client = client
+    sandbox_handlers.start_prewarm(client)
+
+    response = await mcp_server.call_tool("create_sandbox", {})
+
+    assert "Timeout Error" in response[0].text
+    assert calls == [3600]
+    release.set()
+    await sandbox_handlers.aclose_prewarm()
+    assert client.created_sandbox_ids == ["sbx-new"]
+    assert deleted == ["sbx-new"]
+
+
+@pytest.mark.asyncio
+async def test_call_tool_maps_errors_by_exception_type(caplog):
+    import logging
+
+    from shipyard_neo.errors import NotFoundError
+
+    class ErrorSkills(FakeSkills):
+        async def create_candidate(self, **_kwargs):
+            raise NotFoundError("no such execution")
+
+        async def rollback_release(self, release_id: str):
+            raise RuntimeError("kaboom")
+
+    mcp_server._client = FakeClient(skills=ErrorSkills())
+
+    response = await mcp_server.call_tool(
+        "create_skill_candidate",
+        {"skill_key": "csv-loader", "source_execution_ids": ["exec-1"]},
+    )
+    assert response[0].text.startswith("**API Error:** [not_found]")
+
+    with caplog.at_level(logging.ERROR, logger="shipyard_neo_mcp"):
+        response = await mcp_server.call_tool(
+            "rollback_skill_release", {"release_id": "sr-1"}
+        )
+    assert response[0].text == "**Error:** kaboom"
+    assert "unexpected_error tool=rollback_skill_release" in caplog.text
+    assert "RuntimeError: kaboom" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_repeated_unexpected_errors_log_once_per_window(caplog, monkeypatch):
+    import logging
+
+    now = [100.0]
+    monkeypatch.setattr(dispatch_mod, "_clock", lambda: now[0])
+
+    class ErrorSkills(FakeSkills):
+        async def rollback_release(self, release_id: str):
+            raise RuntimeError("kaboom")
+
+    mcp_server._client = FakeClient(skills=ErrorSkills())
+
+    with caplog.at_level(logging.ERROR, logger="shipyard_neo_mcp"):
+        for _ in range(3):
+            response = await mcp_server.call_tool(
+                "rollback_skill_release", {"release_id": "sr-1"}
+            )
+            assert response[0].text == "**Error:** kaboom"
+        assert caplog.text.count("unexpected_error") == 1
+
+        now[0] += 1.5
+        await mcp_server.call_tool("rollback_skill_release", {"release_id": "sr-1"})
+        assert caplog.text.count("unexpected_error") == 2
+
+
+def test_format_bay_error_caps_details():
+    error = BayError("boom", details={f"k{i}": "v" * 100 for i in range(1000)})
+
+    text = mcp_server._format_bay_error(error)
+
+    details = text.split("details: ", 1)[1]
+    assert details.startswith('{"k0":"' + "v" * 100)
+    assert details.endswith("...[truncated; serialized output exceeds 1000 chars]")
+    assert len(details) < 1100
+
+
 @pytest.mark.asyncio
 async def test_validation_error_for_missing_required_argument():
     mcp_server._client = FakeClient()
@@ -697,9 +1394,58 @@ async def test_execute_python_truncates_large_output():
     assert "execution_id: exec-long" in response[0].text
 
 
+@pytest.mark.asyncio
+async def test_read_file_truncates_large_content(monkeypatch):
+    class LargeFilesystem(FakeFilesystem):
+        async def read_file(self, path: str) -> str:
+            return "y" * 30
+
+    monkeypatch.setattr(mcp_server, "_MAX_TOOL_TEXT_CHARS", 10)
+    sandbox = FakeSandbox()
+    sandbox.filesystem = LargeFilesystem()
+    mcp_server._client = FakeClient()
+    mcp_server._sandboxes["sbx-1"] = sandbox
+
+    response = await mcp_server.call_tool(
+        "read_file", {"sandbox_id": "sbx-1", "path": "big.txt"}
+    )
+
+    assert response[0].text == (
+        "**File: big.txt**\n\n```\n"
+        + mcp_server._truncate_text("y" * 30, limit=10)
+        + "\n```"
+    )
+    assert "...[truncated 20 chars; original=30]" in response[0].text
+
+
+def test_validate_relative_path_rejects_only_real_traversal_segments():
+    assert mcp_server._validate_relative_path("notes.txt") == "notes.txt"
+    assert mcp_server._validate_relative_path("a..b/c...txt") == "a..b/c...txt"
+    for path in ("..", "../x", "a/../b", "a/.."):
+        with pytest.raises(ValueError, match="path traversal"):
+            mcp_server._validate_relative_path(path)
+    with pytest.raises(ValueError, match="absolute paths"):
+        mcp_server._validate_relative_path("/etc/passwd")
+
+
+def test_validate_local_path_normalizes_without_resolving(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+
+    assert mcp_server._validate_local_path("link/./a.txt", resolve=False) == (
+        Path.cwd() / "link" / "a.txt"
+    )
+    assert mcp_server._validate_local_path("link/a.txt") == (
+        (tmp_path / "real" / "a.txt").resolve()
+    )
+    with pytest.raises(ValueError, match="null bytes"):
+        mcp_server._validate_local_path("a\x00b", resolve=False)
+
+
 def test_cache_eviction_keeps_bounded_size(monkeypatch):
     monkeypatch.setattr(mcp_server, "_MAX_SANDBOX_CACHE_SIZE", 2)
-    mcp_server._sandboxes = OrderedDict()
+    mcp_server._sandboxes = {}
 
     mcp_server._cache_sandbox(SimpleNamespace(id="sbx-1"))
     mcp_server._cache_sandbox(SimpleNamespace(id="sbx-2"))
@@ -708,6 +1454,176 @@ def test_cache_eviction_keeps_bounded_size(monkeypatch):
     assert list(mcp_server._sandboxes.keys()) == ["sbx-2", "sbx-3"]
 
 
+@pytest.mark.asyncio
+async def test_get_sandbox_fetches_stay_within_cache_bound(monkeypatch):
+    class FetchingClient(FakeClient):
+        async def get_sandbox(self, sandbox_id: str):
+            return SimpleNamespace(id=sandbox_id)
+
+    monkeypatch.setattr(mcp_server, "_MAX_SANDBOX_CACHE_SIZE", 3)
+    mcp_server._client = FetchingClient()
+
+    for index in range(10):
+        await mcp_server.get_sandbox(f"sbx-{index}")
+
+    assert list(mcp_server._sandboxes.keys()) == ["sbx-7", "sbx-8", "sbx-9"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_sandbox_misses_share_one_fetch():
+    fetched: list[str] = []
+
+    class FetchingClient(FakeClient):
+        async def get_sandbox(self, sandbox_id: str):
+            fetched.append(sandbox_id)
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(id=sandbox_id)
+
+    mcp_server._client = FetchingClient()
+
+    results = await asyncio.gather(
+        *(mcp_server.get_sandbox("sbx-1") for _ in range(5)),
+        mcp_server.get_sandbox("sbx-2"),
+    )
+
+    assert sorted(fetched) == ["sbx-1", "sbx-2"]
+    assert all(result is results[0] for result in results[:5])
+    assert mcp_server._cache_mod._fetch_locks == {}
+    assert mcp_server._cache_mod._fetch_waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_get_sandbox_failed_fetch_keeps_lock_for_queued_callers():
+    fail_first = asyncio.Event()
+    finish = asyncio.Event()
+    fetches = 0
+
+    class FlakyClient(FakeClient):
+        async def get_sandbox(self, sandbox_id: str):
+            nonlocal fetches
+            fetches += 1
+            if fetches == 1:
+                await fail_first.wait()
+                raise RuntimeError("bay unavailable")
+            await finish.wait()
+            return SimpleNamespace(id=sandbox_id)
+
+    mcp_server._client = FlakyClient()
+
+    first = asyncio.create_task(mcp_server.get_sandbox("sbx-1"))
+    queued = [asyncio.create_task(mcp_server.get_sandbox("sbx-1")) for _ in range(2)]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert fetches == 1
+
+    # The first fetch fails and hands the lock to a queued caller; a caller
+    # arriving now must queue behind it instead of fetching in parallel.
+    fail_first.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    late = asyncio.create_task(mcp_server.get_sandbox("sbx-1"))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert fetches == 2
+
+    finish.set()
+    with pytest.raises(RuntimeError, match="bay unavailable"):
+        await first
+    results = await asyncio.gather(*queued, late)
+
+    assert fetches == 2
+    assert all(result is results[0] for result in results)
+    assert mcp_server._cache_mod._fetch_locks == {}
+    assert mcp_server._cache_mod._fetch_waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_get_sandbox_hit_refreshes_lru_order(monkeypatch):
+    monkeypatch.setattr(mcp_server, "_MAX_SANDBOX_CACHE_SIZE", 2)
+    mcp_server._client = FakeClient()
+    mcp_server._cache_sandbox(SimpleNamespace(id="sbx-1"))
+    mcp_server._cache_sandbox(SimpleNamespace(id="sbx-2"))
+
+    await mcp_server.get_sandbox("sbx-1")
+    mcp_server._cache_sandbox(SimpleNamespace(id="sbx-3"))
+
+    assert list(mcp_server._sandboxes.keys()) == ["sbx-1", "sbx-3"]
+
+
+@pytest.mark.asyncio
+async def test_get_sandbox_refetches_entries_past_expires_at():
+    fetched: list[str] = []
+
+    class FetchingClient(FakeClient):
+        async def get_sandbox(self, sandbox_id: str):
+            fetched.append(sandbox_id)
+            return SimpleNamespace(id=sandbox_id, expires_at=None)
+
+    now = datetime.now(timezone.utc)
+    mcp_server._client = FetchingClient()
+    mcp_server._cache_sandbox(
+        SimpleNamespace(id="sbx-live", expires_at=now + timedelta(hours=1))
+    )
+    mcp_server._cache_sandbox(
+        SimpleNamespace(id="sbx-old", expires_at=now - timedelta(seconds=1))
+    )
+
+    live = await mcp_server.get_sandbox("sbx-live")
+    refreshed = await mcp_server.get_sandbox("sbx-old")
+
+    assert live.expires_at > now
+    assert refreshed.expires_at is None
+    assert fetched == ["sbx-old"]
+    assert mcp_server._sandboxes["sbx-old"] is refreshed
+
+
+class TrackedSandbox:
+    """Minimal weak-referenceable sandbox stand-in."""
+
+    def __init__(self, sandbox_id: str) -> None:
+        self.id = sandbox_id
+
+
+@pytest.mark.asyncio
+async def test_get_sandbox_reuses_evicted_sandbox_still_in_use(monkeypatch):
+    fetched: list[str] = []
+
+    class FetchingClient(FakeClient):
+        async def get_sandbox(self, sandbox_id: str):
+            fetched.append(sandbox_id)
+            return TrackedSandbox(sandbox_id)
+
+    monkeypatch.setattr(mcp_server, "_MAX_SANDBOX_CACHE_SIZE", 1)
+    mcp_server._client = FetchingClient()
+
+    held = await mcp_server.get_sandbox("sbx-1")
+    await mcp_server.get_sandbox("sbx-2")
+    assert list(mcp_server._sandboxes.keys()) == ["sbx-2"]
+
+    assert await mcp_server.get_sandbox("sbx-1") is held
+    assert fetched == ["sbx-1", "sbx-2"]
+    assert list(mcp_server._sandboxes.keys()) == ["sbx-1"]
+
+
+def test_evicted_sandbox_is_released_once_unreferenced(monkeypatch):
+    monkeypatch.setattr(mcp_server, "_MAX_SANDBOX_CACHE_SIZE", 1)
+
+    mcp_server._cache_sandbox(TrackedSandbox("sbx-1"))
+    mcp_server._cache_sandbox(TrackedSandbox("sbx-2"))
+    gc.collect()
+
+    assert "sbx-1" not in mcp_server._cache_mod._live_sandboxes
+    assert "sbx-2" in mcp_server._cache_mod._live_sandboxes
+
+
+def test_cache_sandbox_accepts_objects_without_weakref_support():
+    # SimpleNamespace instances cannot be weakly referenced.
+    mcp_server._cache_sandbox(SimpleNamespace(id="sbx-1"))
+
+    assert list(mcp_server._sandboxes.keys()) == ["sbx-1"]
+    assert "sbx-1" not in mcp_server._cache_mod._live_sandboxes
+
+
 # -- Browser capability tests --
 
 
@@ -1209,6 +2125,42 @@ async def test_timeout_error_returns_friendly_message():
     assert "Timeout Error" in response[0].text
 
 
+@pytest.mark.asyncio
+async def test_slow_sdk_call_hits_sdk_call_timeout(monkeypatch):
+    """SDK calls exceeding SDK_CALL_TIMEOUT are cancelled and reported as timeouts."""
+
+    class SlowSandbox(FakeSandbox):
+        class SlowPython:
+            async def exec(self, *_args, **_kwargs):
+                await asyncio.sleep(5)
+
+        def __init__(self):
+            super().__init__()
+            self.python = self.SlowPython()
+
+    monkeypatch.setattr(mcp_server, "_SDK_CALL_TIMEOUT", 0.01)
+    mcp_server._sandboxes["sbx-1"] = SlowSandbox()
+    mcp_server._client = FakeClient()
+
+    response = await mcp_server.call_tool(
+        "execute_python",
+        {"sandbox_id": "sbx-1", "code": "print('x')"},
+    )
+    assert "Timeout Error" in response[0].text
+
+
+@pytest.mark.asyncio
+async def test_call_with_timeout_propagates_outer_cancellation():
+    """Cancelling the caller must not be reported as a timeout."""
+    from shipyard_neo_mcp.timeouts import call_with_timeout
+
+    task = asyncio.ensure_future(call_with_timeout(asyncio.sleep(5), 10))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
 def test_validate_sandbox_id_accepts_hyphens_and_underscores():
     """_validate_sandbox_id should accept alphanumeric, hyphens, underscores."""
     result = mcp_server._validate_sandbox_id({"sandbox_id": "sbx-123_test"})
@@ -1221,18 +2173,68 @@ def test_validate_sandbox_id_rejects_dots():
         mcp_server._validate_sandbox_id({"sandbox_id": "sbx.123"})
 
 
+def test_validate_sandbox_id_rejects_trailing_newline():
+    with pytest.raises(ValueError, match="invalid sandbox_id format"):
+        mcp_server._validate_sandbox_id({"sandbox_id": "sbx-1\n"})
+
+
 def test_validate_sandbox_id_rejects_spaces():
     """_validate_sandbox_id should reject spaces."""
     with pytest.raises(ValueError, match="invalid sandbox_id format"):
         mcp_server._validate_sandbox_id({"sandbox_id": "sbx 123"})
 
 
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {},
+        {"sandbox_id": "sbx 1"},
+        {"sandbox_id": "sbx-1\n"},
+        {"sandbox_id": "sbx-1"},
+        {"sandbox_id": "sbx-1", "code": "x", "timeout": True},
+        {"sandbox_id": "sbx-1", "code": "x", "timeout": 0},
+        {"sandbox_id": "sbx-1", "code": "x", "timeout": 301},
+        {"sandbox_id": "sbx-1", "code": "x", "flag": "yes"},
+        {"sandbox_id": "sbx-1", "code": "x", "tags": 1},
+        {"sandbox_id": "sbx-1", "code": "x", "exec_type": 1},
+        {"sandbox_id": "sbx-1", "code": "x", "exec_type": "ruby"},
+    ],
+)
+def test_build_validator_matches_helper_errors(arguments):
+    from shipyard_neo_mcp.validators import build_validator
+
+    validate = build_validator(
+        ("sandbox_id", "sandbox_id"),
+        ("str", "code"),
+        ("int", "timeout", 30, 1, 300),
+        ("bool", "flag", False),
+        ("optional_str", "tags"),
+        ("exec_type", "exec_type"),
+    )
+
+    def reference(args):
+        return (
+            mcp_server._validate_sandbox_id(args),
+            mcp_server._require_str(args, "code"),
+            mcp_server._read_int(args, "timeout", 30, min_value=1, max_value=300),
+            mcp_server._read_bool(args, "flag", False),
+            mcp_server._optional_str(args, "tags"),
+            mcp_server._read_exec_type(args, "exec_type"),
+        )
+
+    with pytest.raises(ValueError) as expected:
+        reference(arguments)
+    with pytest.raises(ValueError) as actual:
+        validate(arguments)
+    assert str(actual.value) == str(expected.value)
+
+
 def test_cache_eviction_logs_evicted_id(monkeypatch, caplog):
     """Cache eviction should log the evicted sandbox ID."""
     import logging
 
     monkeypatch.setattr(mcp_server, "_MAX_SANDBOX_CACHE_SIZE", 1)
-    mcp_server._sandboxes = OrderedDict()
+    mcp_server._sandboxes = {}
 
     with caplog.at_level(logging.DEBUG, logger="shipyard_neo_mcp"):
         mcp_server._cache_sandbox(SimpleNamespace(id="sbx-1"))
@@ -1243,6 +2245,22 @@ def test_cache_eviction_logs_evicted_id(monkeypatch, caplog):
     assert list(mcp_server._sandboxes.keys()) == ["sbx-2"]
 
 
+def test_get_config_reads_environment_once(monkeypatch):
+    monkeypatch.setenv("SHIPYARD_ENDPOINT_URL", "http://localhost:8000")
+    monkeypatch.setenv("SHIPYARD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setenv("SHIPYARD_DEFAULT_TTL", "120")
+
+    first = mcp_server.get_config()
+    monkeypatch.setenv("SHIPYARD_DEFAULT_TTL", "999")
+
+    assert mcp_server.get_config() is first
+    assert first["default_ttl"] == 120
+    with pytest.raises(TypeError):
+        first["default_ttl"] = 1
+    mcp_server.reset_config()
+    assert mcp_server.get_config()["default_ttl"] == 999
+
+
 @pytest.mark.asyncio
 async def test_create_sandbox_logs_info(caplog, monkeypatch):
     """create_sandbox should log sandbox creation."""
@@ -1257,7 +2275,35 @@ async def test_create_sandbox_logs_info(caplog, monkeypatch):
 
     assert "sandbox_created" in caplog.text
     assert "sbx-new" in caplog.text
-    assert "Sandbox created successfully" in response[0].text
+    assert response[0].text == (
+        "Sandbox created successfully.\n\n"
+        "**Sandbox ID:** `sbx-new`\n"
+        "**Profile:** python-default\n"
+        "**Status:** ready\n"
+        "**Capabilities:** python, shell, filesystem\n"
+        "**TTL:** 3600 seconds\n\n"
+        "Use this sandbox_id for subsequent operations."
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_sandbox_default_call_follows_config(monkeypatch):
+    monkeypatch.setenv("SHIPYARD_ENDPOINT_URL", "http://localhost:8000")
+    monkeypatch.setenv("SHIPYARD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setenv("SHIPYARD_DEFAULT_TTL", "120")
+    mcp_server._client = FakeClient()
+
+    first = await mcp_server.call_tool("create_sandbox", {})
+    monkeypatch.setenv("SHIPYARD_DEFAULT_TTL", "240")
+    cached = await mcp_server.call_tool("create_sandbox", {})
+    mcp_server.reset_config()
+    reloaded = await mcp_server.call_tool("create_sandbox", {})
+    overridden = await mcp_server.call_tool("create_sandbox", {"ttl": 5})
+
+    assert "**TTL:** 120 seconds" in first[0].text
+    assert "**TTL:** 120 seconds" in cached[0].text
+    assert "**TTL:** 240 seconds" in reloaded[0].text
+    assert "**TTL:** 5 seconds" in overridden[0].text
 
 
 @pytest.mark.asyncio
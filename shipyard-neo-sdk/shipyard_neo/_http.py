@@ -1,6 +1,8 @@
 """HTTP client wrapper for Bay API.
 
 Handles connection pooling, error mapping, and request/response serialization.
+JSON bodies are encoded and decoded with pydantic-core (already required
+through pydantic) rather than the stdlib json module.
 """
 
 from __future__ import annotations
@@ -8,14 +10,26 @@ from __future__ import annotations
 import asyncio
 import logging
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import httpx
+from pydantic_core import from_json, to_json
 
 from shipyard_neo.errors import raise_for_error_response
 
+if TYPE_CHECKING:
+    from httpx._client import UseClientDefault
+
 logger = logging.getLogger("shipyard_neo")
 
+# Raw body returned for empty responses (e.g. 204), so raw callers can
+# always hand it to a JSON model validator.
+_EMPTY_JSON = b"{}"
+
+# Connection pool for the single shared httpx client. Idle connections keep
+# httpx's default expiry, which stays within uvicorn's 5s keep-alive window.
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+
 
 class HTTPClient:
     """Async HTTP client for Bay API.
@@ -33,6 +47,10 @@ class HTTPClient:
         access_token: str,
         timeout: float = 30.0,
         max_retries: int = 3,
+        *,
+        connect_timeout: float = 5.0,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ) -> None:
         """Initialize HTTP client.
 
@@ -41,13 +59,34 @@ class HTTPClient:
             access_token: Bearer token for authentication
             timeout: Default request timeout in seconds
             max_retries: Maximum retry attempts for transient errors
+            connect_timeout: Upper bound on connection setup, also applied to
+                requests that pass a longer per-request timeout
+            limits: Connection pool limits (defaults to DEFAULT_LIMITS)
+            http2: Negotiate HTTP/2 so concurrent requests share connections
+                (requires the ``http2`` extra). Only takes effect behind an
+                HTTP/2-capable proxy; uvicorn itself serves HTTP/1.1.
         """
         self._base_url = base_url.rstrip("/")
         self._access_token = access_token
         self._timeout = timeout
         self._max_retries = max_retries
+        self._connect_timeout = connect_timeout
+        self._limits = limits or DEFAULT_LIMITS
+        self._http2 = http2
         self._client: httpx.AsyncClient | None = None
 
+    def _request_timeout(self, timeout: float | None) -> httpx.Timeout | UseClientDefault:
+        """Map a per-request timeout to an httpx timeout.
+
+        ``None`` keeps the client default (passing ``None`` to httpx would
+        disable timeouts entirely). Explicit values, such as the long
+        execution timeouts, apply to reads and writes while connection
+        setup stays capped at ``connect_timeout``.
+        """
+        if timeout is None:
+            return httpx.USE_CLIENT_DEFAULT
+        return httpx.Timeout(timeout, connect=min(self._connect_timeout, timeout))
+
     @staticmethod
     def _is_retryable_method(method: str, *, has_idempotency_key: bool) -> bool:
         method_upper = method.upper()
@@ -67,7 +106,7 @@ class HTTPClient:
     @staticmethod
     def _parse_json_or_error_payload(response: httpx.Response) -> dict[str, Any]:
         try:
-            payload = response.json()
+            payload = from_json(response.content)
             if isinstance(payload, dict):
                 return payload
             return {"data": payload}
@@ -93,7 +132,9 @@ class HTTPClient:
         # This allows multipart uploads to set their own content type
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
-            timeout=httpx.Timeout(self._timeout),
+            timeout=httpx.Timeout(self._timeout, connect=min(self._connect_timeout, self._timeout)),
+            limits=self._limits,
+            http2=self._http2,
             headers={
                 "Authorization": f"Bearer {self._access_token}",
             },
@@ -118,6 +159,32 @@ class HTTPClient:
             raise RuntimeError("HTTPClient not initialized. Use 'async with' context.")
         return self._client
 
+    @overload
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = ...,
+        params: dict[str, Any] | None = ...,
+        idempotency_key: str | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[False] = ...,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = ...,
+        params: dict[str, Any] | None = ...,
+        idempotency_key: str | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[True],
+    ) -> bytes: ...
+
     async def request(
         self,
         method: str,
@@ -127,7 +194,8 @@ class HTTPClient:
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
         timeout: float | None = None,
-    ) -> dict[str, Any]:
+        raw: bool = False,
+    ) -> dict[str, Any] | bytes:
         """Make an HTTP request to Bay API.
 
         Args:
@@ -137,9 +205,13 @@ class HTTPClient:
             params: Query parameters
             idempotency_key: Optional idempotency key header
             timeout: Override default timeout for this request
+            raw: Return the undecoded body of a successful response, so the
+                caller can parse it straight into a model. An empty body
+                (including 204) is returned as ``b"{}"``, matching the ``{}``
+                returned without ``raw``.
 
         Returns:
-            Parsed JSON response body
+            Parsed JSON response body, or its bytes when ``raw`` is set
 
         Raises:
             BayError: On API error responses
@@ -164,16 +236,18 @@ class HTTPClient:
             has_idempotency_key=has_idempotency_key,
         )
         max_attempts = self._max_retries + 1 if retryable_method else 1
+        request_timeout = self._request_timeout(timeout)
+        content = to_json(json) if json is not None else None
 
         for attempt in range(max_attempts):
             try:
                 response = await self.client.request(
                     method,
                     path,
-                    json=json,
+                    content=content,
                     params=params,
                     headers=headers if headers else None,
-                    timeout=timeout,
+                    timeout=request_timeout,
                 )
             except (httpx.TimeoutException, httpx.TransportError):
                 if retryable_method and attempt < max_attempts - 1:
@@ -184,7 +258,7 @@ class HTTPClient:
             logger.debug("Response: %s %s", response.status_code, path)
 
             if response.status_code == 204:
-                return {}
+                return _EMPTY_JSON if raw else {}
 
             # Retry on transient HTTP status for retryable methods.
             if (
@@ -195,6 +269,8 @@ class HTTPClient:
                 await asyncio.sleep(self._retry_delay_seconds(attempt))
                 continue
 
+            if raw and response.status_code < 400:
+                return response.content or _EMPTY_JSON
             body = self._parse_json_or_error_payload(response)
             if response.status_code >= 400:
                 raise_for_error_response(response.status_code, body)
@@ -203,15 +279,58 @@ class HTTPClient:
         # Defensive fallback, loop should always return/raise.
         raise RuntimeError("HTTP request attempt loop exhausted unexpectedly")
 
+    @overload
+    async def get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[False] = ...,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[True],
+    ) -> bytes: ...
+
     async def get(
         self,
         path: str,
         *,
         params: dict[str, Any] | None = None,
         timeout: float | None = None,
-    ) -> dict[str, Any]:
+        raw: bool = False,
+    ) -> dict[str, Any] | bytes:
         """Make a GET request."""
-        return await self.request("GET", path, params=params, timeout=timeout)
+        return await self.request("GET", path, params=params, timeout=timeout, raw=raw)
+
+    @overload
+    async def post(
+        self,
+        path: str,
+        *,
+        json: dict[str, Any] | None = ...,
+        idempotency_key: str | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[False] = ...,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def post(
+        self,
+        path: str,
+        *,
+        json: dict[str, Any] | None = ...,
+        idempotency_key: str | None = ...,
+        timeout: float | None = ...,
+        raw: Literal[True],
+    ) -> bytes: ...
 
     async def post(
         self,
@@ -220,7 +339,8 @@ class HTTPClient:
         json: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
         timeout: float | None = None,
-    ) -> dict[str, Any]:
+        raw: bool = False,
+    ) -> dict[str, Any] | bytes:
         """Make a POST request."""
         return await self.request(
             "POST",
@@ -228,6 +348,7 @@ class HTTPClient:
             json=json,
             idempotency_key=idempotency_key,
             timeout=timeout,
+            raw=raw,
         )
 
     async def put(
@@ -276,7 +397,7 @@ class HTTPClient:
                     path,
                     files=files,
                     data=data,
-                    timeout=timeout,
+                    timeout=self._request_timeout(timeout),
                 )
             except (httpx.TimeoutException, httpx.TransportError):
                 if attempt < max_attempts - 1:
@@ -317,13 +438,14 @@ class HTTPClient:
 
         retryable_method = self._is_retryable_method("GET", has_idempotency_key=False)
         max_attempts = self._max_retries + 1 if retryable_method else 1
+        request_timeout = self._request_timeout(timeout)
 
         for attempt in range(max_attempts):
             try:
                 response = await self.client.get(
                     path,
                     params=params,
-                    timeout=timeout,
+                    timeout=request_timeout,
                 )
             except (httpx.TimeoutException, httpx.TransportError):
                 if retryable_method and attempt < max_attempts - 1:
@@ -2,11 +2,68 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from shipyard_neo.errors import RequestTimeoutError
 
 if TYPE_CHECKING:
     from shipyard_neo._http import HTTPClient
 
+# Upper bound of a single python/shell/browser exec call (see the request
+# models in shipyard_neo.types).
+_MAX_EXEC_TIMEOUT = 300
+
+# Extra seconds past the HTTP timeout before an exec call is abandoned
+# client-side, covering event-loop delays the socket timeout does not see.
+_DEADLINE_SLACK = 2.0
+
+# Exact Python type of every exec request field; the optional ones may
+# also be None.
+_FIELD_TYPES: dict[str, type] = {
+    "code": str,
+    "command": str,
+    "cmd": str,
+    "commands": list,
+    "timeout": int,
+    "cwd": str,
+    "include_code": bool,
+    "stop_on_error": bool,
+    "description": str,
+    "tags": str,
+    "learn": bool,
+    "include_trace": bool,
+}
+_OPTIONAL_FIELDS = frozenset({"cwd", "description", "tags"})
+
+
+def _request_body(
+    model: type[BaseModel], fields: dict[str, Any], *, max_timeout: int
+) -> dict[str, Any]:
+    """Build a request body, validating through ``model`` only when needed.
+
+    Well-typed, in-range arguments (the normal case) are sent as a plain
+    dict with ``None`` values dropped. Anything else goes through the
+    request model, so invalid input raises the same ValidationError.
+    """
+    for key, value in fields.items():
+        if value is None and key in _OPTIONAL_FIELDS:
+            continue
+        if type(value) is not _FIELD_TYPES[key]:
+            break
+    else:
+        timeout = fields["timeout"]
+        commands = fields.get("commands", ("",))
+        if (
+            1 <= timeout <= max_timeout
+            and commands
+            and all(type(command) is str for command in commands)
+        ):
+            return {key: value for key, value in fields.items() if value is not None}
+    return model.model_validate(fields).model_dump(exclude_none=True)
+
 
 class BaseCapability:
     """Base class for sandbox capabilities.
@@ -24,8 +81,29 @@ class BaseCapability:
         """
         self._http = http
         self._sandbox_id = sandbox_id
+        # Base path for this capability's endpoints; the sandbox ID never
+        # changes, so it is formatted once here.
+        self._base_path = f"/v1/sandboxes/{sandbox_id}"
 
-    @property
-    def _base_path(self) -> str:
-        """Base path for this capability's endpoints."""
-        return f"/v1/sandboxes/{self._sandbox_id}"
+    async def _post_exec(self, url: str, body: dict[str, Any], *, timeout: float) -> bytes:
+        """POST an execution request to ``url`` and return the raw response body.
+
+        ``url`` is the full request path. ``timeout`` is the HTTP timeout.
+        The whole call, including time spent waiting on a busy event loop,
+        is abandoned shortly after it.
+
+        Raises:
+            RequestTimeoutError: If the call outlives its deadline
+        """
+        deadline = timeout + _DEADLINE_SLACK
+        try:
+            return await asyncio.wait_for(
+                self._http.post(url, json=body, timeout=timeout, raw=True),
+                deadline,
+            )
+        except asyncio.TimeoutError:
+            endpoint = url.removeprefix(f"{self._base_path}/")
+            raise RequestTimeoutError(
+                f"{endpoint} did not complete within {deadline:g}s",
+                details={"method": endpoint},
+            ) from None
@@ -2,20 +2,97 @@
 
 from __future__ import annotations
 
-from shipyard_neo.capabilities.base import BaseCapability
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from shipyard_neo.capabilities.base import _MAX_EXEC_TIMEOUT, BaseCapability, _request_body
+from shipyard_neo.errors import BayError
 from shipyard_neo.types import (
     BrowserBatchExecResult,
+    BrowserBatchStepResult,
     BrowserExecResult,
     BrowserSkillRunResult,
+    _BrowserBatchExecRequest,
+    _BrowserExecRequest,
+    _BrowserSkillRunRequest,
 )
 
+if TYPE_CHECKING:
+    from shipyard_neo._http import HTTPClient
+
+# Response parsers, bound once at import to skip the model_validate_* wrappers.
+_parse_exec_result = BrowserExecResult.__pydantic_validator__.validate_json
+_parse_batch_result = BrowserBatchExecResult.__pydantic_validator__.validate_json
+_parse_skill_run = BrowserSkillRunResult.__pydantic_validator__.validate_json
+
+# Upper bound of exec_batch and skill replay calls.
+_MAX_BATCH_TIMEOUT = 600
+
+# Most exec() calls coalesced into one exec_batch request.
+_MAX_COALESCED = 16
+# Adaptive window: twice the smoothed inter-arrival time, at least this
+# many milliseconds and at most batch_window_ms.
+_MIN_ADAPTIVE_WINDOW_MS = 0.5
+# Weight of the newest inter-arrival sample in the moving average.
+_IAT_EWMA_ALPHA = 0.2
+# Commands that only read page state, so identical concurrent calls can
+# share one request (see dedupe_reads). Kept conservative on purpose: waits
+# are left out, since each caller expects a wait of its own.
+_READ_ONLY_PREFIXES = ("get ", "is ", "snapshot")
+
 
 class BrowserCapability(BaseCapability):
     """Browser automation capability.
 
     Executes browser automation commands in the sandbox via the Gull runtime.
+
+    With ``batch_window_ms > 0``, plain ``exec(cmd, timeout=...)`` calls that
+    arrive within that window are coalesced into one ``exec_batch`` request
+    (run in arrival order, ``stop_on_error=False``) and each caller gets its
+    own step back as a ``BrowserExecResult``. Calls that set description,
+    tags, learn or include_trace are always sent on their own. Coalesced
+    results carry no execution_id or trace_ref, history records one entry
+    for the whole batch, and the batch timeout is the sum of the calls'
+    timeouts. Off by default; ``BayClient(browser_batch_window_ms=...)``
+    turns it on for every sandbox the client returns.
+
+    With ``adaptive_window`` the window follows the observed arrival rate
+    instead: twice the moving average of the gap between coalescable
+    calls, capped at ``batch_window_ms``. Sparse calls then wait little,
+    while bursts still share requests. ``batcher_stats()`` reports the
+    current state.
+
+    With ``dedupe_reads``, a plain read-only command (``get ...``,
+    ``is ...``, ``snapshot``) that is already in flight with the same
+    timeout is not sent again; the callers share its result. ``wait ...``
+    commands are always sent, one per caller.
     """
 
+    def __init__(
+        self,
+        http: HTTPClient,
+        sandbox_id: str,
+        *,
+        batch_window_ms: float = 0,
+        adaptive_window: bool = False,
+        dedupe_reads: bool = False,
+    ) -> None:
+        super().__init__(http, sandbox_id)
+        self._exec_url = f"{self._base_path}/browser/exec"
+        self._batch_url = f"{self._base_path}/browser/exec_batch"
+        self.batch_window_ms = batch_window_ms
+        self.adaptive_window = adaptive_window
+        self.dedupe_reads = dedupe_reads
+        self._inflight: dict[tuple[str, int], asyncio.Future[BrowserExecResult]] = {}
+        self._pending: list[tuple[str, int, asyncio.Future[BrowserExecResult]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        self._last_arrival: float | None = None
+        self._ewma_iat_ms: float | None = None
+        self._batches = 0
+        self._batched_calls = 0
+
     async def exec(
         self,
         cmd: str,
@@ -40,24 +117,166 @@ class BrowserCapability(BaseCapability):
             SessionNotReadyError: If session is still starting
             RequestTimeoutError: If execution times out
         """
-        from shipyard_neo.types import _BrowserExecRequest
-
-        body = _BrowserExecRequest(
-            cmd=cmd,
-            timeout=timeout,
-            description=description,
-            tags=tags,
-            learn=learn,
-            include_trace=include_trace,
-        ).model_dump(exclude_none=True)
-
-        response = await self._http.post(
-            f"{self._base_path}/browser/exec",
-            json=body,
+        if (
+            (self.batch_window_ms > 0 or self.dedupe_reads)
+            and description is None
+            and tags is None
+            and not learn
+            and not include_trace
+            and type(cmd) is str
+            and type(timeout) is int
+            and 1 <= timeout <= _MAX_EXEC_TIMEOUT
+        ):
+            if self.dedupe_reads and cmd.startswith(_READ_ONLY_PREFIXES):
+                return await self._exec_shared(cmd, timeout)
+            if self.batch_window_ms > 0:
+                return await self._exec_coalesced(cmd, timeout)
+
+        body = _request_body(
+            _BrowserExecRequest,
+            {
+                "cmd": cmd,
+                "timeout": timeout,
+                "description": description,
+                "tags": tags,
+                "learn": learn,
+                "include_trace": include_trace,
+            },
+            max_timeout=_MAX_EXEC_TIMEOUT,
+        )
+        return await self._send_exec(body, timeout)
+
+    async def _send_exec(self, body: dict[str, Any], timeout: int) -> BrowserExecResult:
+        response = await self._post_exec(
+            self._exec_url,
+            body,
             timeout=float(timeout) + 10,  # Add buffer for network overhead
         )
 
-        return BrowserExecResult.model_validate(response)
+        # Parse the body straight into the model, skipping an intermediate dict.
+        return _parse_exec_result(response)
+
+    async def _exec_plain(self, cmd: str, timeout: int) -> BrowserExecResult:
+        """Run a plain ``exec(cmd, timeout=...)`` call, coalescing it if enabled."""
+        if self.batch_window_ms > 0:
+            return await self._exec_coalesced(cmd, timeout)
+        body = {"cmd": cmd, "timeout": timeout, "learn": False, "include_trace": False}
+        return await self._send_exec(body, timeout)
+
+    async def _exec_shared(self, cmd: str, timeout: int) -> BrowserExecResult:
+        """Join an identical in-flight read, or start one others can join."""
+        key = (cmd, timeout)
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._exec_plain(cmd, timeout))
+            self._inflight[key] = shared
+
+            def forget(done: asyncio.Future[BrowserExecResult]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                # Mark a failure as retrieved even if every caller went away.
+                if not done.cancelled():
+                    done.exception()
+
+            shared.add_done_callback(forget)
+        # Shielded so one caller's cancellation does not cancel the others.
+        return await asyncio.shield(shared)
+
+    async def _exec_coalesced(self, cmd: str, timeout: int) -> BrowserExecResult:
+        """Queue ``cmd`` for the next coalesced exec_batch and await its step."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[BrowserExecResult] = loop.create_future()
+        now = loop.time()
+        if self._last_arrival is not None:
+            gap_ms = (now - self._last_arrival) * 1000
+            ewma = self._ewma_iat_ms
+            self._ewma_iat_ms = gap_ms if ewma is None else ewma + _IAT_EWMA_ALPHA * (gap_ms - ewma)
+        self._last_arrival = now
+        self._pending.append((cmd, timeout, future))
+        # Flush on N queued calls or T ms after the first one, whichever is first.
+        if len(self._pending) >= _MAX_COALESCED:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_ms() / 1000, self._start_flush)
+        return await future
+
+    def _window_ms(self) -> float:
+        """Return how long the first queued call waits for company."""
+        if not self.adaptive_window or self._ewma_iat_ms is None:
+            return self.batch_window_ms
+        return min(max(self._ewma_iat_ms * 2, _MIN_ADAPTIVE_WINDOW_MS), self.batch_window_ms)
+
+    def batcher_stats(self) -> dict[str, Any]:
+        """Return counters describing exec() coalescing on this capability."""
+        return {
+            "queue_depth": len(self._pending),
+            "ewma_iat_ms": self._ewma_iat_ms,
+            "window_ms": self._window_ms(),
+            "batches": self._batches,
+            "avg_batch_size": self._batched_calls / self._batches if self._batches else 0.0,
+        }
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        self._batches += 1
+        self._batched_calls += len(pending)
+        task = asyncio.ensure_future(self._flush(pending))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self, pending: list[tuple[str, int, asyncio.Future[BrowserExecResult]]]
+    ) -> None:
+        """Send queued commands and resolve each caller's future."""
+        pending = [entry for entry in pending if not entry[2].done()]
+        if not pending:
+            return
+        if len(pending) == 1:
+            cmd, timeout, future = pending[0]
+            body = {"cmd": cmd, "timeout": timeout, "learn": False, "include_trace": False}
+            try:
+                result = await self._send_exec(body, timeout)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+            if not future.done():
+                future.set_result(result)
+            return
+
+        try:
+            # Steps run one after another, so the batch gets their summed budget.
+            batch = await self.exec_batch(
+                [cmd for cmd, _, _ in pending],
+                timeout=min(sum(timeout for _, timeout, _ in pending), _MAX_BATCH_TIMEOUT),
+                stop_on_error=False,
+            )
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        steps = {step.step_index: step for step in batch.results}
+        for index, (_, _, future) in enumerate(pending):
+            if future.done():
+                continue
+            step = steps.get(index)
+            if step is None:
+                future.set_exception(BayError("browser batch ended before this command ran"))
+                continue
+            future.set_result(
+                BrowserExecResult(
+                    success=step.exit_code == 0,
+                    output=step.stdout,
+                    error=step.stderr or None,
+                    exit_code=step.exit_code,
+                    execution_time_ms=step.duration_ms,
+                )
+            )
 
     async def exec_batch(
         self,
@@ -69,6 +288,9 @@ class BrowserCapability(BaseCapability):
         tags: str | None = None,
         learn: bool = False,
         include_trace: bool = False,
+        parallel: bool = False,
+        max_concurrent: int = 4,
+        chunk_size: int | None = None,
     ) -> BrowserBatchExecResult:
         """Execute a batch of browser automation commands in the sandbox.
 
@@ -80,6 +302,18 @@ class BrowserCapability(BaseCapability):
             commands: List of browser commands (without 'agent-browser' prefix)
             timeout: Overall timeout in seconds for all commands (1-600)
             stop_on_error: Whether to stop on first failure
+            parallel: With ``stop_on_error=False``, send the commands as
+                concurrent exec() calls instead of one server-side sequence.
+                Only for commands that do not depend on each other's page
+                state. Each step then has its own execution record, so the
+                result carries no batch-level execution_id.
+            max_concurrent: Max commands in flight when ``parallel`` is used
+            chunk_size: Send longer command lists as consecutive batches of
+                at most this many commands, in order, so no single request
+                or response grows unbounded. ``timeout`` then applies per
+                chunk, and with ``stop_on_error`` later chunks are skipped
+                after a failing one. The result carries no batch-level
+                execution_id.
 
         Returns:
             BrowserBatchExecResult with per-step results and overall status
@@ -89,25 +323,164 @@ class BrowserCapability(BaseCapability):
             SessionNotReadyError: If session is still starting
             RequestTimeoutError: If execution times out
         """
-        from shipyard_neo.types import _BrowserBatchExecRequest
-
-        body = _BrowserBatchExecRequest(
-            commands=commands,
-            timeout=timeout,
-            stop_on_error=stop_on_error,
-            description=description,
-            tags=tags,
-            learn=learn,
-            include_trace=include_trace,
-        ).model_dump(exclude_none=True)
-
-        response = await self._http.post(
-            f"{self._base_path}/browser/exec_batch",
-            json=body,
+        body = _request_body(
+            _BrowserBatchExecRequest,
+            {
+                "commands": commands,
+                "timeout": timeout,
+                "stop_on_error": stop_on_error,
+                "description": description,
+                "tags": tags,
+                "learn": learn,
+                "include_trace": include_trace,
+            },
+            max_timeout=_MAX_BATCH_TIMEOUT,
+        )
+
+        if parallel and not stop_on_error:
+            return await self._exec_parallel(
+                commands,
+                timeout=min(timeout, _MAX_EXEC_TIMEOUT),
+                max_concurrent=max_concurrent,
+                description=description,
+                tags=tags,
+                learn=learn,
+                include_trace=include_trace,
+            )
+
+        if chunk_size is not None and len(commands) > chunk_size:
+            return await self._exec_chunked(
+                commands,
+                chunk_size=chunk_size,
+                timeout=timeout,
+                stop_on_error=stop_on_error,
+                description=description,
+                tags=tags,
+                learn=learn,
+                include_trace=include_trace,
+            )
+
+        response = await self._post_exec(
+            self._batch_url,
+            body,
             timeout=float(timeout) + 15,  # Add buffer for network overhead
         )
 
-        return BrowserBatchExecResult.model_validate(response)
+        # Parse the body straight into the model, skipping an intermediate dict.
+        return _parse_batch_result(response)
+
+    async def _exec_chunked(
+        self,
+        commands: list[str],
+        *,
+        chunk_size: int,
+        timeout: int,
+        stop_on_error: bool,
+        description: str | None,
+        tags: str | None,
+        learn: bool,
+        include_trace: bool,
+    ) -> BrowserBatchExecResult:
+        """Run ``commands`` as consecutive exec_batch calls and stitch the results."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        steps: list[BrowserBatchStepResult] = []
+        completed_steps = 0
+        duration_ms = 0
+        success = True
+        for start in range(0, len(commands), chunk_size):
+            chunk = await self.exec_batch(
+                commands[start : start + chunk_size],
+                timeout=timeout,
+                stop_on_error=stop_on_error,
+                description=description,
+                tags=tags,
+                learn=learn,
+                include_trace=include_trace,
+            )
+            steps.extend(
+                step.model_copy(update={"step_index": start + step.step_index})
+                for step in chunk.results
+            )
+            completed_steps += chunk.completed_steps
+            duration_ms += chunk.duration_ms
+            if not chunk.success:
+                success = False
+                if stop_on_error:
+                    break
+
+        return BrowserBatchExecResult(
+            results=steps,
+            total_steps=len(commands),
+            completed_steps=completed_steps,
+            success=success,
+            duration_ms=duration_ms,
+        )
+
+    async def _exec_parallel(
+        self,
+        commands: list[str],
+        *,
+        timeout: int,
+        max_concurrent: int,
+        description: str | None,
+        tags: str | None,
+        learn: bool,
+        include_trace: bool,
+    ) -> BrowserBatchExecResult:
+        """Fan ``commands`` out as concurrent exec() calls and merge the results."""
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        slots = asyncio.Semaphore(max_concurrent)
+
+        async def run(cmd: str) -> BrowserExecResult:
+            async with slots:
+                return await self.exec(
+                    cmd,
+                    timeout=timeout,
+                    description=description,
+                    tags=tags,
+                    learn=learn,
+                    include_trace=include_trace,
+                )
+
+        started = time.monotonic()
+        outcomes = await asyncio.gather(*(run(cmd) for cmd in commands), return_exceptions=True)
+        duration_ms = int((time.monotonic() - started) * 1000)
+
+        steps: list[BrowserBatchStepResult] = []
+        for index, (cmd, outcome) in enumerate(zip(commands, outcomes, strict=True)):
+            if isinstance(outcome, BayError):
+                # A failed call is one failed step, as with stop_on_error=False.
+                steps.append(
+                    BrowserBatchStepResult(
+                        cmd=cmd, stdout="", stderr=str(outcome), exit_code=-1, step_index=index
+                    )
+                )
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            exit_code = outcome.exit_code
+            if exit_code is None:
+                exit_code = 0 if outcome.success else 1
+            steps.append(
+                BrowserBatchStepResult(
+                    cmd=cmd,
+                    stdout=outcome.output,
+                    stderr=outcome.error or "",
+                    exit_code=exit_code,
+                    step_index=index,
+                    duration_ms=outcome.execution_time_ms or 0,
+                )
+            )
+
+        return BrowserBatchExecResult(
+            results=steps,
+            total_steps=len(commands),
+            completed_steps=len(steps),
+            success=all(step.exit_code == 0 for step in steps),
+            duration_ms=duration_ms,
+        )
 
     async def run_skill(
         self,
@@ -120,19 +493,21 @@ class BrowserCapability(BaseCapability):
         tags: str | None = None,
     ) -> BrowserSkillRunResult:
         """Replay active browser skill release in this sandbox."""
-        from shipyard_neo.types import _BrowserSkillRunRequest
-
-        body = _BrowserSkillRunRequest(
-            timeout=timeout,
-            stop_on_error=stop_on_error,
-            include_trace=include_trace,
-            description=description,
-            tags=tags,
-        ).model_dump(exclude_none=True)
+        body = _request_body(
+            _BrowserSkillRunRequest,
+            {
+                "timeout": timeout,
+                "stop_on_error": stop_on_error,
+                "include_trace": include_trace,
+                "description": description,
+                "tags": tags,
+            },
+            max_timeout=_MAX_BATCH_TIMEOUT,
+        )
 
-        response = await self._http.post(
+        response = await self._post_exec(
             f"{self._base_path}/browser/skills/{skill_key}/run",
-            json=body,
+            body,
             timeout=float(timeout) + 15,
         )
-        return BrowserSkillRunResult.model_validate(response)
+        return _parse_skill_run(response)
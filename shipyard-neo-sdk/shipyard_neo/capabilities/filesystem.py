@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from shipyard_neo.capabilities.base import BaseCapability
-from shipyard_neo.types import FileInfo
+from shipyard_neo.types import FileInfo, _FileWriteRequest
 
 
 class FilesystemCapability(BaseCapability):
@@ -44,8 +44,6 @@ class FilesystemCapability(BaseCapability):
         Raises:
             InvalidPathError: If path is invalid
         """
-        from shipyard_neo.types import _FileWriteRequest
-
         body = _FileWriteRequest(path=path, content=content).model_dump(exclude_none=True)
 
         await self._http.put(
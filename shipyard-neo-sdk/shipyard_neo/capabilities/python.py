@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
-from shipyard_neo.capabilities.base import BaseCapability
-from shipyard_neo.types import PythonExecResult
+from typing import TYPE_CHECKING
+
+from shipyard_neo.capabilities.base import _MAX_EXEC_TIMEOUT, BaseCapability, _request_body
+from shipyard_neo.types import PythonExecResult, _PythonExecRequest
+
+if TYPE_CHECKING:
+    from shipyard_neo._http import HTTPClient
+
+# Bound once at import to skip the model_validate_json wrapper.
+_parse_result = PythonExecResult.__pydantic_validator__.validate_json
 
 
 class PythonCapability(BaseCapability):
@@ -13,6 +21,10 @@ class PythonCapability(BaseCapability):
     Variables persist across calls within the same session.
     """
 
+    def __init__(self, http: HTTPClient, sandbox_id: str) -> None:
+        super().__init__(http, sandbox_id)
+        self._exec_url = f"{self._base_path}/python/exec"
+
     async def exec(
         self,
         code: str,
@@ -39,20 +51,22 @@ class PythonCapability(BaseCapability):
             RequestTimeoutError: If execution times out
             ShipError: If runtime error occurs
         """
-        from shipyard_neo.types import _PythonExecRequest
-
-        body = _PythonExecRequest(
-            code=code,
-            timeout=timeout,
-            include_code=include_code,
-            description=description,
-            tags=tags,
-        ).model_dump(exclude_none=True)
-
-        response = await self._http.post(
-            f"{self._base_path}/python/exec",
-            json=body,
+        body = _request_body(
+            _PythonExecRequest,
+            {
+                "code": code,
+                "timeout": timeout,
+                "include_code": include_code,
+                "description": description,
+                "tags": tags,
+            },
+            max_timeout=_MAX_EXEC_TIMEOUT,
+        )
+
+        response = await self._post_exec(
+            self._exec_url,
+            body,
             timeout=float(timeout) + 10,  # Add buffer for network overhead
         )
 
-        return PythonExecResult.model_validate(response)
+        return _parse_result(response)
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
-from shipyard_neo.capabilities.base import BaseCapability
-from shipyard_neo.types import ShellExecResult
+from typing import TYPE_CHECKING
+
+from shipyard_neo.capabilities.base import _MAX_EXEC_TIMEOUT, BaseCapability, _request_body
+from shipyard_neo.types import ShellExecResult, _ShellExecRequest
+
+if TYPE_CHECKING:
+    from shipyard_neo._http import HTTPClient
+
+# Bound once at import to skip the model_validate_json wrapper.
+_parse_result = ShellExecResult.__pydantic_validator__.validate_json
 
 
 class ShellCapability(BaseCapability):
@@ -12,6 +20,10 @@ class ShellCapability(BaseCapability):
     Executes shell commands in the sandbox.
     """
 
+    def __init__(self, http: HTTPClient, sandbox_id: str) -> None:
+        super().__init__(http, sandbox_id)
+        self._exec_url = f"{self._base_path}/shell/exec"
+
     async def exec(
         self,
         command: str,
@@ -41,21 +53,23 @@ class ShellCapability(BaseCapability):
             ShipError: If runtime error occurs
             InvalidPathError: If cwd is invalid
         """
-        from shipyard_neo.types import _ShellExecRequest
-
-        body = _ShellExecRequest(
-            command=command,
-            timeout=timeout,
-            cwd=cwd,
-            include_code=include_code,
-            description=description,
-            tags=tags,
-        ).model_dump(exclude_none=True)
-
-        response = await self._http.post(
-            f"{self._base_path}/shell/exec",
-            json=body,
+        body = _request_body(
+            _ShellExecRequest,
+            {
+                "command": command,
+                "timeout": timeout,
+                "cwd": cwd,
+                "include_code": include_code,
+                "description": description,
+                "tags": tags,
+            },
+            max_timeout=_MAX_EXEC_TIMEOUT,
+        )
+
+        response = await self._post_exec(
+            self._exec_url,
+            body,
             timeout=float(timeout) + 10,
         )
 
-        return ShellExecResult.model_validate(response)
+        return _parse_result(response)
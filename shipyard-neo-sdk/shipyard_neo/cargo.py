@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from shipyard_neo.types import CargoInfo, CargoList
+from shipyard_neo.types import CargoInfo, CargoList, _CreateCargoRequest
 
 if TYPE_CHECKING:
     from shipyard_neo._http import HTTPClient
@@ -41,8 +41,6 @@ class CargoManager:
         Returns:
             CargoInfo for the created cargo
         """
-        from shipyard_neo.types import _CreateCargoRequest
-
         body = _CreateCargoRequest(size_limit_mb=size_limit_mb).model_dump(exclude_none=True)
 
         response = await self._http.post(
@@ -9,7 +9,13 @@ from shipyard_neo._http import HTTPClient
 from shipyard_neo.cargo import CargoManager
 from shipyard_neo.sandbox import Sandbox
 from shipyard_neo.skills import SkillManager
-from shipyard_neo.types import ProfileList, SandboxInfo, SandboxList, SandboxStatus
+from shipyard_neo.types import (
+    ProfileList,
+    SandboxInfo,
+    SandboxList,
+    SandboxStatus,
+    _CreateSandboxRequest,
+)
 
 
 class BayClient:
@@ -34,6 +40,11 @@ class BayClient:
         *,
         timeout: float = 30.0,
         max_retries: int = 3,
+        connect_timeout: float = 5.0,
+        http2: bool = False,
+        browser_batch_window_ms: float = 0,
+        browser_adaptive_window: bool = False,
+        browser_dedupe_reads: bool = False,
     ) -> None:
         """Initialize Bay client.
 
@@ -42,6 +53,21 @@ class BayClient:
             access_token: Bearer token for authentication. Falls back to BAY_TOKEN env var.
             timeout: Default request timeout in seconds. Falls back to BAY_TIMEOUT env var.
             max_retries: Maximum retry attempts. Falls back to BAY_MAX_RETRIES env var.
+            connect_timeout: Upper bound on connection setup in seconds, even for
+                requests with a longer per-request timeout.
+            http2: Use HTTP/2 when the server supports it, multiplexing
+                concurrent requests over shared connections. Bay itself is
+                served by uvicorn, which speaks HTTP/1.1 only, so this only
+                helps behind an HTTP/2-capable reverse proxy; otherwise the
+                connection stays on HTTP/1.1. Requires the ``http2`` extra
+                (``pip install shipyard-neo-sdk[http2]``).
+            browser_batch_window_ms: Coalesce plain ``sandbox.browser.exec``
+                calls arriving within this many milliseconds into one
+                ``exec_batch`` request. 0 (default) disables coalescing.
+            browser_adaptive_window: Size the coalescing window from the
+                observed call rate, capped at ``browser_batch_window_ms``.
+            browser_dedupe_reads: Let identical concurrent read-only browser
+                commands share one request.
 
         Raises:
             ValueError: If endpoint_url or access_token not provided and not in env.
@@ -65,6 +91,11 @@ class BayClient:
 
         self._timeout = timeout
         self._max_retries = max_retries
+        self._connect_timeout = connect_timeout
+        self._http2 = http2
+        self._browser_batch_window_ms = browser_batch_window_ms
+        self._browser_adaptive_window = browser_adaptive_window
+        self._browser_dedupe_reads = browser_dedupe_reads
         self._http: HTTPClient | None = None
 
         # Cargo manager (initialized lazily with HTTP client)
@@ -78,6 +109,8 @@ class BayClient:
             access_token=self._access_token,
             timeout=self._timeout,
             max_retries=self._max_retries,
+            connect_timeout=self._connect_timeout,
+            http2=self._http2,
         )
         await self._http.__aenter__()
         self._cargos = CargoManager(self._http)
@@ -120,6 +153,16 @@ class BayClient:
 
     # Sandbox operations
 
+    def _sandbox(self, info: SandboxInfo) -> Sandbox:
+        """Wrap sandbox info in a Sandbox configured with this client's options."""
+        return Sandbox(
+            self.http,
+            info,
+            browser_batch_window_ms=self._browser_batch_window_ms,
+            browser_adaptive_window=self._browser_adaptive_window,
+            browser_dedupe_reads=self._browser_dedupe_reads,
+        )
+
     async def create_sandbox(
         self,
         *,
@@ -139,8 +182,6 @@ class BayClient:
         Returns:
             Sandbox object for the created sandbox
         """
-        from shipyard_neo.types import _CreateSandboxRequest
-
         body = _CreateSandboxRequest(profile=profile, cargo_id=cargo_id, ttl=ttl).model_dump(
             exclude_none=True
         )
@@ -151,7 +192,7 @@ class BayClient:
             idempotency_key=idempotency_key,
         )
         info = SandboxInfo.model_validate(response)
-        return Sandbox(self.http, info)
+        return self._sandbox(info)
 
     async def get_sandbox(self, sandbox_id: str) -> Sandbox:
         """Get an existing sandbox.
@@ -167,7 +208,7 @@ class BayClient:
         """
         response = await self.http.get(f"/v1/sandboxes/{sandbox_id}")
         info = SandboxInfo.model_validate(response)
-        return Sandbox(self.http, info)
+        return self._sandbox(info)
 
     async def list_sandboxes(
         self,
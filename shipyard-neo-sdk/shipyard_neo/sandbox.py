@@ -14,6 +14,7 @@ from shipyard_neo.types import (
     ExecutionHistoryList,
     SandboxInfo,
     SandboxStatus,
+    _ExtendTTLRequest,
 )
 
 if TYPE_CHECKING:
@@ -32,12 +33,24 @@ class Sandbox:
     Capabilities will auto-start a session if needed.
     """
 
-    def __init__(self, http: HTTPClient, info: SandboxInfo) -> None:
+    def __init__(
+        self,
+        http: HTTPClient,
+        info: SandboxInfo,
+        *,
+        browser_batch_window_ms: float = 0,
+        browser_adaptive_window: bool = False,
+        browser_dedupe_reads: bool = False,
+    ) -> None:
         """Initialize Sandbox.
 
         Args:
             http: HTTP client for making requests
             info: Sandbox information from API
+            browser_batch_window_ms: Passed to BrowserCapability as
+                ``batch_window_ms``
+            browser_adaptive_window: Passed as ``adaptive_window``
+            browser_dedupe_reads: Passed as ``dedupe_reads``
         """
         self._http = http
         self._info = info
@@ -46,7 +59,13 @@ class Sandbox:
         self.python = PythonCapability(http, info.id)
         self.shell = ShellCapability(http, info.id)
         self.filesystem = FilesystemCapability(http, info.id)
-        self.browser = BrowserCapability(http, info.id)
+        self.browser = BrowserCapability(
+            http,
+            info.id,
+            batch_window_ms=browser_batch_window_ms,
+            adaptive_window=browser_adaptive_window,
+            dedupe_reads=browser_dedupe_reads,
+        )
 
     # Properties from SandboxInfo
 
@@ -133,8 +152,6 @@ class Sandbox:
             SandboxExpiredError: If sandbox has already expired
             SandboxTTLInfiniteError: If sandbox has infinite TTL
         """
-        from shipyard_neo.types import _ExtendTTLRequest
-
         body = _ExtendTTLRequest(extend_by=seconds).model_dump(exclude_none=True)
 
         response = await self._http.post(
@@ -177,21 +194,23 @@ class Sandbox:
                 "has_notes": has_notes,
                 "has_description": has_description,
             },
+            raw=True,
         )
-        return ExecutionHistoryList.model_validate(response)
+        return ExecutionHistoryList.model_validate_json(response)
 
     async def get_execution(self, execution_id: str) -> ExecutionHistoryEntry:
         """Get one execution history record by ID."""
-        response = await self._http.get(f"/v1/sandboxes/{self.id}/history/{execution_id}")
-        return ExecutionHistoryEntry.model_validate(response)
+        response = await self._http.get(f"/v1/sandboxes/{self.id}/history/{execution_id}", raw=True)
+        return ExecutionHistoryEntry.model_validate_json(response)
 
     async def get_last_execution(self, *, exec_type: str | None = None) -> ExecutionHistoryEntry:
         """Get the latest execution history record."""
         response = await self._http.get(
             f"/v1/sandboxes/{self.id}/history/last",
             params={"exec_type": exec_type},
+            raw=True,
         )
-        return ExecutionHistoryEntry.model_validate(response)
+        return ExecutionHistoryEntry.model_validate_json(response)
 
     async def annotate_execution(
         self,
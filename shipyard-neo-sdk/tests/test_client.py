@@ -1,5 +1,6 @@
 """Tests for BayClient."""
 
+import asyncio
 import json
 import re
 
@@ -159,6 +160,46 @@ class TestBayClient:
             assert result.execution_time_ms == 4
             assert result.code == "print('hello')"
 
+    @pytest.mark.asyncio
+    async def test_python_and_shell_exec_send_plain_bodies(self, httpx_mock, mock_sandbox_response):
+        """Exec bodies should drop unset optional fields and still validate bad input."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes",
+            json=mock_sandbox_response,
+            status_code=201,
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes/sbx_123/python/exec",
+            match_json={"code": "1 + 1", "timeout": 30, "include_code": False},
+            json={"success": True, "output": "2", "error": None, "data": None},
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes/sbx_123/shell/exec",
+            match_json={
+                "command": "ls",
+                "timeout": 5,
+                "cwd": "src",
+                "include_code": False,
+                "tags": "t",
+            },
+            json={"success": True, "output": "", "error": None, "exit_code": 0},
+        )
+
+        async with BayClient(
+            endpoint_url="http://localhost:8000",
+            access_token="test-token",
+        ) as client:
+            sandbox = await client.create_sandbox()
+            await sandbox.python.exec("1 + 1")
+            await sandbox.shell.exec("ls", timeout=5, cwd="src", tags="t")
+            with pytest.raises(ValidationError):
+                await sandbox.python.exec("1 + 1", timeout=301)
+            with pytest.raises(ValidationError):
+                await sandbox.shell.exec("ls", timeout=0)
+
     @pytest.mark.asyncio
     async def test_sandbox_execution_history_methods(self, httpx_mock, mock_sandbox_response):
         """Sandbox history methods should map API responses correctly."""
@@ -463,6 +504,38 @@ class TestBayClient:
             assert result.execution_time_ms == 18
             assert result.trace_ref == "blob:trace-1"
 
+    @pytest.mark.asyncio
+    async def test_browser_coalescing_options_reach_sandboxes(
+        self, httpx_mock, mock_sandbox_response
+    ):
+        """BayClient browser_* options should configure each sandbox's browser."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes",
+            json=mock_sandbox_response,
+            status_code=201,
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url="http://localhost:8000/v1/sandboxes/sbx_123",
+            json=mock_sandbox_response,
+        )
+
+        async with BayClient(
+            endpoint_url="http://localhost:8000",
+            access_token="test-token",
+            browser_batch_window_ms=5,
+            browser_adaptive_window=True,
+            browser_dedupe_reads=True,
+        ) as client:
+            for sandbox in (
+                await client.create_sandbox(),
+                await client.get_sandbox("sbx_123"),
+            ):
+                assert sandbox.browser.batch_window_ms == 5
+                assert sandbox.browser.adaptive_window is True
+                assert sandbox.browser.dedupe_reads is True
+
     @pytest.mark.asyncio
     async def test_browser_exec_with_timeout(self, httpx_mock, mock_sandbox_response):
         """Browser exec should support custom timeout."""
@@ -757,6 +830,313 @@ class TestBayClient:
             assert result.results[1].exit_code == 1
             assert result.results[1].stderr == "Element not found: @e99"
 
+    @pytest.mark.asyncio
+    async def test_browser_exec_batch_parallel_fans_out_exec_calls(
+        self, httpx_mock, mock_sandbox_response
+    ):
+        """Parallel exec_batch should send one exec per command and merge the results."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes",
+            json=mock_sandbox_response,
+            status_code=201,
+        )
+        exec_url = "http://localhost:8000/v1/sandboxes/sbx_123/browser/exec"
+        httpx_mock.add_response(
+            method="POST",
+            url=exec_url,
+            match_json={
+                "cmd": "get title",
+                "timeout": 60,
+                "learn": False,
+                "include_trace": False,
+            },
+            json={
+                "success": True,
+                "output": "Example\n",
+                "exit_code": 0,
+                "execution_id": "exec-1",
+                "execution_time_ms": 12,
+            },
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url=exec_url,
+            match_json={
+                "cmd": "get url",
+                "timeout": 60,
+                "learn": False,
+                "include_trace": False,
+            },
+            json={"success": False, "output": "", "error": "no page", "exit_code": 2},
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url=exec_url,
+            match_json={
+                "cmd": "get count",
+                "timeout": 60,
+                "learn": False,
+                "include_trace": False,
+            },
+            status_code=503,
+            json={"error": {"code": "session_not_ready", "message": "warming up"}},
+        )
+
+        async with BayClient(
+            endpoint_url="http://localhost:8000",
+            access_token="test-token",
+        ) as client:
+            sandbox = await client.create_sandbox()
+            result = await sandbox.browser.exec_batch(
+                ["get title", "get url", "get count"],
+                stop_on_error=False,
+                parallel=True,
+            )
+
+        assert [step.cmd for step in result.results] == ["get title", "get url", "get count"]
+        assert [step.step_index for step in result.results] == [0, 1, 2]
+        assert result.results[0].stdout == "Example\n"
+        assert result.results[0].duration_ms == 12
+        assert result.results[1].exit_code == 2
+        assert result.results[1].stderr == "no page"
+        assert result.results[2].exit_code == -1
+        assert "warming up" in result.results[2].stderr
+        assert result.success is False
+        assert result.total_steps == result.completed_steps == 3
+        assert result.execution_id is None
+        assert not any(
+            request.url.path.endswith("/exec_batch") for request in httpx_mock.get_requests()
+        )
+
+    @pytest.mark.asyncio
+    async def test_browser_exec_batch_chunks_long_command_lists(
+        self, httpx_mock, mock_sandbox_response
+    ):
+        """chunk_size should send consecutive batches and stop after a failing chunk."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes",
+            json=mock_sandbox_response,
+            status_code=201,
+        )
+        batch_url = "http://localhost:8000/v1/sandboxes/sbx_123/browser/exec_batch"
+
+        def step(cmd: str, index: int, exit_code: int = 0) -> dict[str, object]:
+            return {
+                "cmd": cmd,
+                "stdout": cmd,
+                "stderr": "",
+                "exit_code": exit_code,
+                "step_index": index,
+                "duration_ms": 5,
+            }
+
+        httpx_mock.add_response(
+            method="POST",
+            url=batch_url,
+            match_json={
+                "commands": ["a", "b"],
+                "timeout": 60,
+                "stop_on_error": True,
+                "learn": False,
+                "include_trace": False,
+            },
+            json={
+                "results": [step("a", 0), step("b", 1)],
+                "total_steps": 2,
+                "completed_steps": 2,
+                "success": True,
+                "duration_ms": 10,
+            },
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url=batch_url,
+            match_json={
+                "commands": ["c", "d"],
+                "timeout": 60,
+                "stop_on_error": True,
+                "learn": False,
+                "include_trace": False,
+            },
+            json={
+                "results": [step("c", 0, exit_code=1)],
+                "total_steps": 2,
+                "completed_steps": 1,
+                "success": False,
+                "duration_ms": 5,
+            },
+        )
+
+        async with BayClient(
+            endpoint_url="http://localhost:8000",
+            access_token="test-token",
+        ) as client:
+            sandbox = await client.create_sandbox()
+            result = await sandbox.browser.exec_batch(["a", "b", "c", "d", "e"], chunk_size=2)
+
+        assert [(s.cmd, s.step_index) for s in result.results] == [("a", 0), ("b", 1), ("c", 2)]
+        assert result.total_steps == 5
+        assert result.completed_steps == 3
+        assert result.duration_ms == 15
+        assert result.success is False
+        assert len(httpx_mock.get_requests(url=batch_url)) == 2
+
+    @pytest.mark.asyncio
+    async def test_browser_exec_coalesces_concurrent_calls(self, httpx_mock, mock_sandbox_response):
+        """With a batch window, concurrent exec calls share one exec_batch request."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes",
+            json=mock_sandbox_response,
+            status_code=201,
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes/sbx_123/browser/exec_batch",
+            match_json={
+                "commands": ["get title", "get url"],
+                "timeout": 40,
+                "stop_on_error": False,
+                "learn": False,
+                "include_trace": False,
+            },
+            json={
+                "results": [
+                    {
+                        "cmd": "get title",
+                        "stdout": "Example\n",
+                        "stderr": "",
+                        "exit_code": 0,
+                        "step_index": 0,
+                        "duration_ms": 7,
+                    },
+                    {
+                        "cmd": "get url",
+                        "stdout": "",
+                        "stderr": "no page",
+                        "exit_code": 1,
+                        "step_index": 1,
+                        "duration_ms": 3,
+                    },
+                ],
+                "total_steps": 2,
+                "completed_steps": 2,
+                "success": False,
+            },
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes/sbx_123/browser/exec",
+            match_json={
+                "cmd": "snapshot -i",
+                "timeout": 30,
+                "learn": False,
+                "include_trace": False,
+            },
+            json={"success": True, "output": "tree", "exit_code": 0, "execution_id": "e-1"},
+        )
+
+        async with BayClient(
+            endpoint_url="http://localhost:8000",
+            access_token="test-token",
+        ) as client:
+            sandbox = await client.create_sandbox()
+            sandbox.browser.batch_window_ms = 5
+            title, url = await asyncio.gather(
+                sandbox.browser.exec("get title"),
+                sandbox.browser.exec("get url", timeout=10),
+            )
+            alone = await sandbox.browser.exec("snapshot -i")
+
+        assert title.success is True
+        assert title.output == "Example\n"
+        assert title.execution_time_ms == 7
+        assert url.success is False
+        assert url.error == "no page"
+        assert url.exit_code == 1
+        assert alone.execution_id == "e-1"
+
+    @pytest.mark.asyncio
+    async def test_browser_exec_dedupe_reads_shares_inflight_request(
+        self, httpx_mock, mock_sandbox_response
+    ):
+        """Identical concurrent reads should share one request; actions and waits should not."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes",
+            json=mock_sandbox_response,
+            status_code=201,
+        )
+        exec_url = "http://localhost:8000/v1/sandboxes/sbx_123/browser/exec"
+        httpx_mock.add_response(
+            method="POST",
+            url=exec_url,
+            match_json={
+                "cmd": "get title",
+                "timeout": 30,
+                "learn": False,
+                "include_trace": False,
+            },
+            json={"success": True, "output": "Example", "exit_code": 0},
+        )
+        for cmd in ("click @e1", "click @e1", "wait 1000", "wait 1000"):
+            httpx_mock.add_response(
+                method="POST",
+                url=exec_url,
+                match_json={
+                    "cmd": cmd,
+                    "timeout": 30,
+                    "learn": False,
+                    "include_trace": False,
+                },
+                json={"success": True, "output": "", "exit_code": 0},
+            )
+
+        async with BayClient(
+            endpoint_url="http://localhost:8000",
+            access_token="test-token",
+            browser_dedupe_reads=True,
+        ) as client:
+            sandbox = await client.create_sandbox()
+            first, second, *_ = await asyncio.gather(
+                sandbox.browser.exec("get title"),
+                sandbox.browser.exec("get title"),
+                sandbox.browser.exec("click @e1"),
+                sandbox.browser.exec("click @e1"),
+                sandbox.browser.exec("wait 1000"),
+                sandbox.browser.exec("wait 1000"),
+            )
+
+        assert first.output == second.output == "Example"
+        assert len(httpx_mock.get_requests(url=exec_url)) == 5
+        assert sandbox.browser._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_browser_exec_rejects_out_of_range_timeout(
+        self, httpx_mock, mock_sandbox_response
+    ):
+        """Browser exec should validate arguments before sending a request."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://localhost:8000/v1/sandboxes",
+            json=mock_sandbox_response,
+            status_code=201,
+        )
+
+        async with BayClient(
+            endpoint_url="http://localhost:8000",
+            access_token="test-token",
+        ) as client:
+            sandbox = await client.create_sandbox()
+            with pytest.raises(ValidationError):
+                await sandbox.browser.exec("snapshot -i", timeout=301)
+            with pytest.raises(ValidationError):
+                await sandbox.browser.exec_batch(["snapshot -i"], timeout=0)
+
+        assert len(httpx_mock.get_requests()) == 1
+
     @pytest.mark.asyncio
     async def test_browser_exec_batch_forwards_learning_fields(
         self, httpx_mock, mock_sandbox_response
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+
 import pytest
+from pytest_httpx import IteratorStream
 
 from shipyard_neo import BayClient
 from shipyard_neo.errors import BayError, NotFoundError, ShipError
@@ -135,3 +139,203 @@ async def test_non_json_502_maps_to_ship_error_with_bounded_snippet(httpx_mock):
     details = exc_info.value.details
     assert details["raw_response_truncated"] is True
     assert len(details["raw_response_snippet"]) == 500
+
+
+@pytest.mark.asyncio
+async def test_requests_without_timeout_use_client_default(httpx_mock):
+    httpx_mock.add_response(
+        method="GET",
+        url="http://localhost:8000/v1/sandboxes?limit=10",
+        json={"items": [], "next_cursor": None},
+    )
+
+    async with BayClient(
+        endpoint_url="http://localhost:8000",
+        access_token="test-token",
+        timeout=12.0,
+        connect_timeout=3.0,
+    ) as client:
+        await client.list_sandboxes(limit=10)
+
+    timeout = httpx_mock.get_request().extensions["timeout"]
+    assert timeout == {"connect": 3.0, "read": 12.0, "write": 12.0, "pool": 12.0}
+
+
+@pytest.mark.asyncio
+async def test_long_request_timeout_keeps_connect_timeout_short(httpx_mock):
+    httpx_mock.add_response(
+        method="POST",
+        url="http://localhost:8000/v1/sandboxes/sbx_123/python/exec",
+        json={"success": True, "output": "", "error": None, "data": None},
+    )
+
+    async with BayClient(
+        endpoint_url="http://localhost:8000",
+        access_token="test-token",
+        connect_timeout=3.0,
+    ) as client:
+        await client.http.post(
+            "/v1/sandboxes/sbx_123/python/exec",
+            json={"code": "pass"},
+            timeout=310.0,
+        )
+
+    timeout = httpx_mock.get_request().extensions["timeout"]
+    assert timeout == {"connect": 3.0, "read": 310.0, "write": 310.0, "pool": 310.0}
+
+
+@pytest.mark.asyncio
+async def test_raw_post_returns_body_bytes_and_still_maps_errors(httpx_mock):
+    url = "http://localhost:8000/v1/sandboxes/sbx_123/browser/exec"
+    httpx_mock.add_response(method="POST", url=url, content=b'{"success": true}')
+    httpx_mock.add_response(
+        method="POST",
+        url=url,
+        status_code=404,
+        json={"error": {"code": "not_found", "message": "Sandbox not found"}},
+    )
+
+    async with BayClient(
+        endpoint_url="http://localhost:8000",
+        access_token="test-token",
+    ) as client:
+        body = await client.http.post("/v1/sandboxes/sbx_123/browser/exec", raw=True)
+        assert body == b'{"success": true}'
+        with pytest.raises(NotFoundError):
+            await client.http.post("/v1/sandboxes/sbx_123/browser/exec", raw=True)
+
+
+@pytest.mark.asyncio
+async def test_json_bodies_are_encoded_compactly(httpx_mock):
+    httpx_mock.add_response(
+        method="POST",
+        url="http://localhost:8000/v1/sandboxes/sbx_123/python/exec",
+        json={"success": True, "output": "é", "error": None, "data": None},
+    )
+
+    async with BayClient(
+        endpoint_url="http://localhost:8000",
+        access_token="test-token",
+    ) as client:
+        body = await client.http.post(
+            "/v1/sandboxes/sbx_123/python/exec",
+            json={"code": "print('é')", "timeout": 30},
+        )
+
+    request = httpx_mock.get_request()
+    assert request.headers["content-type"] == "application/json"
+    assert request.content == '{"code":"print(\'é\')","timeout":30}'.encode()
+    assert body["output"] == "é"
+
+
+@pytest.mark.asyncio
+async def test_raw_empty_responses_read_as_empty_json_object(httpx_mock):
+    url = "http://localhost:8000/v1/sandboxes/sbx_123/history/exec-1"
+    httpx_mock.add_response(method="GET", url=url, status_code=204)
+    httpx_mock.add_response(method="GET", url=url, content=b"")
+
+    async with BayClient(
+        endpoint_url="http://localhost:8000",
+        access_token="test-token",
+    ) as client:
+        no_content = await client.http.get("/v1/sandboxes/sbx_123/history/exec-1", raw=True)
+        empty = await client.http.get("/v1/sandboxes/sbx_123/history/exec-1", raw=True)
+
+    assert no_content == empty == b"{}"
+
+
+@pytest.mark.asyncio
+async def test_raw_post_decodes_compressed_batch_responses(httpx_mock):
+    url = "http://localhost:8000/v1/sandboxes/sbx_123/browser/exec_batch"
+    payload = b'{"results": [], "total_steps": 0, "completed_steps": 0, "success": true}'
+    httpx_mock.add_response(
+        method="POST",
+        url=url,
+        headers={"content-encoding": "gzip"},
+        stream=IteratorStream([gzip.compress(payload)]),
+    )
+
+    async with BayClient(
+        endpoint_url="http://localhost:8000",
+        access_token="test-token",
+    ) as client:
+        body = await client.http.post(
+            "/v1/sandboxes/sbx_123/browser/exec_batch", json={"commands": []}, raw=True
+        )
+
+    assert "gzip" in httpx_mock.get_request().headers["accept-encoding"]
+    assert body == payload
+
+
+@pytest.mark.asyncio
+async def test_http2_option_reaches_the_httpx_client(httpx_mock):
+    pytest.importorskip("h2")
+    httpx_mock.add_response(
+        method="GET",
+        url="http://localhost:8000/v1/sandboxes?limit=10",
+        json={"items": [], "next_cursor": None},
+    )
+
+    async with BayClient(
+        endpoint_url="http://localhost:8000",
+        access_token="test-token",
+        http2=True,
+    ) as client:
+        assert client.http._http2 is True
+        await client.list_sandboxes(limit=10)
+
+
+@pytest.mark.asyncio
+async def test_exec_call_past_its_deadline_raises_request_timeout(monkeypatch):
+    from shipyard_neo.capabilities import base
+    from shipyard_neo.capabilities.python import PythonCapability
+    from shipyard_neo.errors import RequestTimeoutError
+
+    class HangingHTTP:
+        async def post(self, *_args, **_kwargs):
+            await asyncio.sleep(3600)
+
+    monkeypatch.setattr(base, "_DEADLINE_SLACK", 0.0)
+    capability = PythonCapability(HangingHTTP(), "sbx_123")
+
+    with pytest.raises(RequestTimeoutError) as exc_info:
+        await capability._post_exec(capability._exec_url, {"code": "pass"}, timeout=0.01)
+    assert exc_info.value.details == {"method": "python/exec"}
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batch_window_tracks_arrivals_and_reports_stats():
+    from pydantic_core import to_json
+
+    from shipyard_neo.capabilities.browser import BrowserCapability
+
+    class BatchHTTP:
+        async def post(self, path, *, json=None, timeout=None, raw=False):
+            steps = [
+                {"cmd": cmd, "stdout": cmd, "stderr": "", "exit_code": 0, "step_index": i}
+                for i, cmd in enumerate(json["commands"])
+            ]
+            return to_json(
+                {
+                    "results": steps,
+                    "total_steps": len(steps),
+                    "completed_steps": len(steps),
+                    "success": True,
+                }
+            )
+
+    browser = BrowserCapability(BatchHTTP(), "sbx_123", batch_window_ms=50, adaptive_window=True)
+    assert browser.batcher_stats()["window_ms"] == 50
+
+    results = await asyncio.gather(*(browser.exec(cmd) for cmd in ("a", "b", "c")))
+
+    assert [result.output for result in results] == ["a", "b", "c"]
+    stats = browser.batcher_stats()
+    assert stats["batches"] == 1
+    assert stats["avg_batch_size"] == 3.0
+    assert stats["queue_depth"] == 0
+    # Back-to-back arrivals shrink the window to its floor...
+    assert stats["window_ms"] == 0.5
+    # ...while sparse traffic is capped at batch_window_ms.
+    browser._ewma_iat_ms = 400.0
+    assert browser.batcher_stats()["window_ms"] == 50